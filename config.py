@@ -4,23 +4,35 @@ Configuration for Otter.ai Transcript Downloader - Production Settings
 import os
 from pathlib import Path
 
-# Otter.ai Credentials (for automated login)
-OTTER_EMAIL = os.getenv("OTTER_EMAIL", "xdpriyesh@gmail.com")
-OTTER_PASSWORD = os.getenv("OTTER_PASSWORD", "Priyesh@123")
+# Project directory - resolved once, every other path derives from it
+BASE_DIR = Path(__file__).resolve().parent
+
+try:
+    from dotenv import load_dotenv  # Optional: read credentials from a local .env file
+    load_dotenv(BASE_DIR / ".env")
+except ImportError:
+    pass
+
+# Otter.ai Credentials (for automated login) - set via environment or .env, never in code
+OTTER_EMAIL = os.environ.get("OTTER_EMAIL")
+OTTER_PASSWORD = os.environ.get("OTTER_PASSWORD")
 
 # Base directory for downloads
-DOWNLOAD_DIR = Path(__file__).parent / "downloads"
+DOWNLOAD_DIR = BASE_DIR / "downloads"
 
 # Session storage file (for persisting login)
-SESSION_FILE = Path(__file__).parent / ".otter_session.json"
+SESSION_FILE = BASE_DIR / ".otter_session.json"
 
-# Progress tracking file (for resuming interrupted downloads)
-PROGRESS_FILE = Path(__file__).parent / ".download_progress.json"
+# A saved session is always tried first; if the check is inconclusive it is still
+# trusted when used (and re-saved) within this many hours - a sliding window, not
+# the time since the last credential login (that is state's session_created)
+SESSION_MAX_AGE_HOURS = 12
 
 # Otter.ai URLs
 OTTER_BASE_URL = "https://otter.ai"
 OTTER_LOGIN_URL = "https://otter.ai/signin"
 OTTER_CONVERSATIONS_URL = "https://otter.ai/my-notes"
+OTTER_API_URL = "https://otter.ai/forward/api/v1"  # Internal web API (session cookies)
 
 # Export formats to download (options: txt, docx, pdf, srt)
 EXPORT_FORMATS = ["txt"]
@@ -30,11 +42,48 @@ PAGE_LOAD_TIMEOUT = 60000  # 60 seconds for page loads
 SCROLL_WAIT_TIME = 2000    # 2 seconds between scrolls
 DOWNLOAD_WAIT_TIME = 30000 # 30 seconds wait for download
 
+# Direct API downloads - pooled HTTP/2 connections, bounded concurrent exports
+API_MAX_CONNECTIONS = 16
+API_CONCURRENCY = 8
+
 # Rate limiting - ULTRA FAST MODE
-DELAY_BETWEEN_DOWNLOADS = 0.5  # Minimal delay
+DELAY_BETWEEN_DOWNLOADS = 0.5  # Minimal delay (per worker)
+
+# Parallel downloads - browser workers sharing one login session
+# Keep this modest (4-8) to stay under Otter's rate limits
+DOWNLOAD_WORKERS = 4
+
+# State persistence - per-meeting changes are journaled; the journal is folded into the state file after N events
+STATE_JOURNAL_COMPACT_EVERY = 2000
+
+# Parallel downloader: save transcripts zstd-compressed (.txt.zst, level 3) instead
+# of plain .txt - needs the optional zstandard package
+COMPRESS_TRANSCRIPTS = False
+TRANSCRIPT_ZSTD_LEVEL = 3
+
+# Logging - the log file gets full progress, the console only warnings and errors
+CONSOLE_LOG_LEVEL = "WARNING"
+FILE_LOG_LEVEL = "INFO"
 
 # Browser settings - MAXIMUM SPEED
 HEADLESS = True   # Headless for speed
 SLOW_MO = 0       # No slowdown
 
+# Last-resort screenshots are JPEG - far smaller and faster to encode than PNG
+SCREENSHOT_JPEG_QUALITY = 70
+
+# Requests the browser aborts - transcripts only need the DOM and its text
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+# otter_parallel.py only reads container text (no visibility checks or
+# screenshots), so it skips stylesheets too - otter_downloader.py keeps CSS
+# everywhere because its popup/visibility checks and screenshots need the layout
+PARALLEL_BLOCKED_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES | {"stylesheet"}
+BLOCKED_DOMAINS = [
+    "googletagmanager.com",
+    "google-analytics.com",
+    "segment.io",
+    "segment.com",
+    "doubleclick.net",
+]
+
 
@@ -15,64 +15,241 @@ Usage:
     python otter_downloader.py
 """
 
+import os
 import json
+import atexit
+import asyncio
 import time
 import argparse
 import re
+import queue
+import shutil
 import logging
+import threading
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, List, Dict, Any
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
+from typing import Optional, List, Dict, Any, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from contextlib import contextmanager
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Route, TimeoutError as PlaywrightTimeout
+
+try:
+    import orjson  # Optional: much faster (de)serialization of the state file
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # Optional: direct API exports without driving the UI
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # Optional: HTTP/2 for httpx (without it, httpx refuses http2=True)
+except ImportError:
+    h2 = None
 
 from config import (
     OTTER_EMAIL, OTTER_PASSWORD,
-    DOWNLOAD_DIR, SESSION_FILE, PROGRESS_FILE,
+    BASE_DIR, DOWNLOAD_DIR, SESSION_FILE,
     OTTER_BASE_URL, OTTER_LOGIN_URL, OTTER_CONVERSATIONS_URL,
     EXPORT_FORMATS, PAGE_LOAD_TIMEOUT, SCROLL_WAIT_TIME,
     DOWNLOAD_WAIT_TIME, DELAY_BETWEEN_DOWNLOADS,
-    HEADLESS, SLOW_MO
+    DOWNLOAD_WORKERS, STATE_JOURNAL_COMPACT_EVERY,
+    SESSION_MAX_AGE_HOURS, BLOCKED_RESOURCE_TYPES, BLOCKED_DOMAINS,
+    OTTER_API_URL, API_MAX_CONNECTIONS, API_CONCURRENCY,
+    HEADLESS, SLOW_MO, SCREENSHOT_JPEG_QUALITY, CONSOLE_LOG_LEVEL, FILE_LOG_LEVEL
 )
 
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
-LOG_FILE = Path(__file__).parent / "otter_download.log"
-STATE_FILE = Path(__file__).parent / ".otter_state.json"
+LOG_FILE = BASE_DIR / "otter_download.log"
+STATE_FILE = BASE_DIR / ".otter_state.json"
+STATE_JOURNAL_FILE = BASE_DIR / ".otter_state.journal.jsonl"
+STATE_JOURNAL_OLD_FILE = BASE_DIR / ".otter_state.journal.old.jsonl"
+
+# Full progress goes to the log file; the console only shows CONSOLE_LOG_LEVEL and up
+file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
+file_handler.setLevel(FILE_LOG_LEVEL)
+console_handler = logging.StreamHandler()
+console_handler.setLevel(CONSOLE_LOG_LEVEL)
 
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s | %(levelname)s | %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding='utf-8'),
-        logging.StreamHandler()
-    ]
+    format='%(asctime)s | %(levelname)s | [%(threadName)s] %(message)s',
+    handlers=[file_handler, console_handler]
 )
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for hot loops
+_ID_RE = re.compile(r'/u/([a-zA-Z0-9_-]+)')  # Meeting links look like /u/<meeting_id>
+_BAD_CHARS_RE = re.compile(r'[<>:"/\\|?*\n\r\t]')
+_WS_RE = re.compile(r'\s+')
+_UNDERSCORES_RE = re.compile(r'_+')
+_LOGGED_IN_URL_RE = re.compile(r'(home|workspace|conversations|my-notes)')
+# Transcript clean-up: trim every line, then drop short lines and navigation/menu text
+_LINE_EDGE_WS_RE = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.M)
+_NOISE_LINE_RE = re.compile(r'^(?:.{0,5}|.*(?:sign out|settings|help|export|share).*)(?:\n|\Z)', re.M | re.I)
+
+# Transcript cards / links in the conversation list
+CONVERSATION_SELECTOR = 'app-home-speech-card, a[href*="/u/"]'
+# Main transcript body on a meeting page (falls back to the page's main area)
+TRANSCRIPT_CONTAINER_SELECTOR = '.otter-transcript-container, main, [role="main"]'
+# Rendered transcript text itself (the container may appear before it fills in)
+TRANSCRIPT_CONTENT_SELECTOR = '.otter-transcript-container, [class*="transcript"]'
+# Infinite-scroll "loading more" indicator: the Material spinner Otter's
+# conversation list shows while fetching (class substrings like "loading"
+# also match skeletons and persistent UI)
+LOADING_SELECTOR = ('.otter-main-content__container mat-spinner, '
+                    '.otter-main-content__container mat-progress-spinner')
+# Give up after this many scrolls without growth, even if a spinner stays up
+SCROLL_STALL_LIMIT = 3
+
+# Selector lists are joined so each lookup is a single DOM query / CDP call
+JOINED_TRANSCRIPT_SELECTOR = ", ".join([
+    '.otter-transcript-container',
+    '[class*="transcript"]',
+    '[class*="speech"]',
+    '.monologue',
+    '.paragraph',
+])
+JOINED_POPUP_SELECTOR = ", ".join([
+    'button[aria-label="Close"]',
+    'button:has-text("Got it")',
+    'button:has-text("×")',
+    '.close-button',
+    '[data-testid="close-button"]',
+    'button:has-text("Dismiss")',
+    'button:has-text("Later")',
+])
+JOINED_MORE_SELECTOR = ", ".join([
+    'button[aria-label*="more" i]',
+    'button[aria-label*="options" i]',
+    'button.head-bar__menu-button',
+    '[data-testid="more-options"]',
+])
+# Accessible name of the Export menu item / dialog button (but not "Re-Export")
+EXPORT_NAME_RE = re.compile(r'(?<!-)\bExport\b')
+JOINED_EXPORT_SELECTOR = ", ".join([
+    '[role="menuitem"]:has-text("Export")',
+    'li:has-text("Export")',
+    'span:has-text("Export")',
+    'button:has-text("Export")',
+])
+MAIN_CONTENT_SELECTORS = ['main', '[role="main"]', '#root', '.app-content']
+
+# Page-side text extraction, in order of preference:
+#   1. the main transcript container, when it holds a real transcript
+#   2. every outermost transcript/speech element (nested matches would repeat text)
+#   3. the first main content area with enough text
+TEXT_EXTRACTION_JS = """([containerSelector, transcriptSelector, mainSelectors]) => {
+    const text = (el) => (el && el.innerText) || '';
+    const container = text(document.querySelector(containerSelector));
+    if (container.length > 500) return container;
+    
+    let combined = Array.from(document.querySelectorAll(transcriptSelector))
+        .filter(el => !(el.parentElement && el.parentElement.closest(transcriptSelector)))
+        .map(el => text(el).trim())
+        .filter(t => t.length > 50)
+        .join('\\n\\n');
+    if (combined.length < 100) {
+        for (const selector of mainSelectors) {
+            const el = document.querySelector(selector);
+            if (el) {
+                combined = text(el);
+                if (combined.length > 200) break;
+            }
+        }
+    }
+    return combined;
+}"""
+
+# Visibility as Playwright defines it (non-empty box, not visibility:hidden),
+# evaluated in the page so a candidate scan is one round trip
+VISIBLE_JS = """(el) => {
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+}"""
+
 
 # ============================================================================
 # STATE MANAGEMENT
 # ============================================================================
+def dump_json_bytes(data: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def dump_json_line(data: Any) -> bytes:
+    """Serialize to a compact single JSON line (journal format)."""
+    if orjson is not None:
+        return orjson.dumps(data) + b'\n'
+    return json.dumps(data, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def load_json_bytes(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# The live DownloadState - the only one flushed at exit
+_active_state: Optional["DownloadState"] = None
+
+
+def _flush_active_state():
+    if _active_state is not None:
+        _active_state.flush()
+
+
+atexit.register(_flush_active_state)
+
+
 class DownloadState:
-    """Comprehensive state tracking for the download process."""
+    """
+    Comprehensive state tracking for the download process (thread-safe).
+    
+    Per-meeting changes are appended to a JSONL journal as they happen, so the
+    hot path never rewrites the whole state file. flush() compacts: it writes a
+    full snapshot and drops the journal entries the snapshot now covers.
+    """
     
     def __init__(self):
         self.state_file = STATE_FILE
+        self.journal_file = STATE_JOURNAL_FILE
+        self.old_journal_file = STATE_JOURNAL_OLD_FILE
         self.state = self._load_state()
+        # In-memory indexes for O(1) lookups; the state file keeps plain lists
+        self._success = set(self.state["successful_downloads"])
+        self._failed = set(self.state["failed_downloads"])
+        self._pending = {
+            meeting_id: info for meeting_id, info in self.state["meetings"].items()
+            if info["status"] in ("pending", "failed")
+        }
+        # Guards in-memory mutations and journal appends; re-entrant for register_meetings_bulk
+        self._lock = threading.RLock()
+        # Serializes file writes so an older snapshot never replaces a newer one
+        self._write_lock = threading.Lock()
+        # Set by journaled changes and save(); flush() only writes when dirty
+        self._dirty = False
+        # Journal: opened on first append, compacted every STATE_JOURNAL_COMPACT_EVERY events
+        self._journal = None
+        self._journal_events = 0
+        self._replay_journal()
+        # Run-level changes not yet in a snapshot get written on interpreter exit;
+        # only the newest instance is flushed, so a discarded one can't overwrite it
+        global _active_state
+        _active_state = self
     
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file or create new state."""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return {
+        state = {
             "session_created": None,
             "last_run": None,
             "meetings": {},  # id -> meeting info + status
@@ -80,89 +257,221 @@ class DownloadState:
             "successful_downloads": [],
             "failed_downloads": [],
             "total_meetings_found": 0,
-            "run_history": []
+            "run_history": [],
+            "preferred_strategy": None,  # method of the most recent successful download
+            "journal_seq": 0  # last journal event included in this snapshot
         }
+        if self.state_file.exists():
+            try:
+                # Fill in any key an older file (or otter_parallel.py) didn't write
+                state.update(load_json_bytes(self.state_file.read_bytes()))
+            except:
+                pass
+        return state
+    
+    def _replay_journal(self):
+        """Apply journal events written after the snapshot (skips torn lines from a crash)."""
+        snapshot_seq = self.state["journal_seq"]
+        for journal_file in (self.old_journal_file, self.journal_file):
+            if not journal_file.exists():
+                continue
+            for line in journal_file.read_bytes().splitlines():
+                try:
+                    event = load_json_bytes(line)
+                except:
+                    continue
+                if event.get("seq", 0) > snapshot_seq:
+                    self._apply_event(event)
+                    self.state["journal_seq"] = event["seq"]
+                    self._journal_events += 1
+                    self._dirty = True
+    
+    def _apply_event(self, event: Dict):
+        """Apply one journal event to the in-memory state (caller holds _lock)."""
+        op = event["op"]
+        meeting_id = event["id"]
+        meetings = self.state["meetings"]
+        
+        if op == "register":
+            if meeting_id not in meetings:
+                meetings[meeting_id] = self._pending[meeting_id] = dict(event["meeting"])
+        
+        elif op == "attempt":
+            self.state["download_attempts"].setdefault(meeting_id, []).append(event["attempt"])
+        
+        elif op == "success":
+            if meeting_id in meetings:
+                meetings[meeting_id]["status"] = "success"
+                meetings[meeting_id]["download_path"] = event["path"]
+                meetings[meeting_id]["file_size"] = event["size"]
+                meetings[meeting_id]["method_used"] = event["method"]
+            self.state["preferred_strategy"] = event["method"]
+            
+            if meeting_id not in self._success:
+                self._success.add(meeting_id)
+                self.state["successful_downloads"].append(meeting_id)
+            
+            self._failed.discard(meeting_id)
+            self._pending.pop(meeting_id, None)
+        
+        elif op == "failure":
+            if meeting_id in meetings:
+                meetings[meeting_id]["status"] = "failed"
+                self._pending[meeting_id] = meetings[meeting_id]
+            
+            self._failed.add(meeting_id)
+    
+    def _record(self, events: List[Dict]):
+        """Apply events and append them to the journal in a single write."""
+        if not events:
+            return
+        with self._lock:
+            lines = []
+            for event in events:
+                self.state["journal_seq"] += 1
+                event["seq"] = self.state["journal_seq"]
+                self._apply_event(event)
+                lines.append(dump_json_line(event))
+            
+            if self._journal is None:
+                # Unbuffered O_APPEND: each batch lands as one write
+                self._journal = open(self.journal_file, 'ab', buffering=0)
+            self._journal.write(b''.join(lines))
+            
+            self._journal_events += len(events)
+            self._dirty = True
+            compact_due = self._journal_events >= STATE_JOURNAL_COMPACT_EVERY
+        if compact_due:
+            self.flush()
+    
+    def _rotate_journal(self):
+        """Move the current journal aside; it is deleted once the next snapshot is on disk."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_events = 0
+        if not self.journal_file.exists():
+            return
+        if self.old_journal_file.exists():
+            # A previous compaction never finished - keep its events too
+            with open(self.old_journal_file, 'ab') as f:
+                f.write(self.journal_file.read_bytes())
+            self.journal_file.unlink()
+        else:
+            os.replace(self.journal_file, self.old_journal_file)
     
     def save(self):
-        """Persist state to file."""
-        self.state["last_run"] = datetime.now().isoformat()
-        with open(self.state_file, 'w', encoding='utf-8') as f:
-            json.dump(self.state, f, indent=2)
+        """Write a snapshot now, for run-level fields changed directly on self.state."""
+        with self._lock:
+            self._dirty = True
+        self.flush()
+    
+    def flush(self):
+        """Atomically write a state snapshot and compact the journal (no-op if clean)."""
+        with self._write_lock:
+            # Take a cheap snapshot under the lock: copy every container that
+            # workers may grow, so serialization never sees it change size
+            with self._lock:
+                if not self._dirty:
+                    return
+                self.state["last_run"] = datetime.now().isoformat()
+                self.state["failed_downloads"] = sorted(self._failed)
+                snapshot = dict(self.state)
+                snapshot["meetings"] = dict(self.state["meetings"])
+                snapshot["download_attempts"] = {
+                    meeting_id: list(attempts)
+                    for meeting_id, attempts in self.state["download_attempts"].items()
+                }
+                snapshot["successful_downloads"] = list(self.state["successful_downloads"])
+                snapshot["run_history"] = list(self.state["run_history"])
+                # Events up to snapshot["journal_seq"] are covered by this snapshot
+                self._rotate_journal()
+                self._dirty = False
+            
+            # Serialize and write without blocking workers on I/O
+            try:
+                # Write a temp file and swap it in so the state file is never half-written
+                tmp_file = self.state_file.with_suffix('.tmp')
+                tmp_file.write_bytes(dump_json_bytes(snapshot))
+                os.replace(tmp_file, self.state_file)
+            except Exception:
+                with self._lock:
+                    self._dirty = True
+                raise
+            
+            if self.old_journal_file.exists():
+                self.old_journal_file.unlink()
     
     def register_meeting(self, meeting_id: str, title: str, url: str):
         """Register a meeting in state."""
-        if meeting_id not in self.state["meetings"]:
-            self.state["meetings"][meeting_id] = {
-                "id": meeting_id,
-                "title": title,
-                "url": url,
-                "status": "pending",
-                "discovered_at": datetime.now().isoformat(),
-                "download_path": None,
-                "file_size": None,
-                "method_used": None
-            }
-        self.save()
+        self.register_meetings_bulk([{"id": meeting_id, "title": title, "url": url}])
+    
+    def register_meetings_bulk(self, meetings: List[Dict]):
+        """Register a batch of discovered meetings with a single journal write."""
+        with self._lock:
+            known = self.state["meetings"]
+            discovered_at = datetime.now().isoformat()
+            events = [
+                {"op": "register", "id": meeting['id'], "meeting": {
+                    "id": meeting['id'],
+                    "title": meeting['title'],
+                    "url": meeting['url'],
+                    "status": "pending",
+                    "discovered_at": discovered_at,
+                    "download_path": None,
+                    "file_size": None,
+                    "method_used": None
+                }}
+                for meeting in meetings if meeting['id'] not in known
+            ]
+        # Recorded outside the lock: _record may compact, which takes _write_lock first
+        self._record(events)
     
     def record_attempt(self, meeting_id: str, method: str, success: bool, error: str = None):
         """Record a download attempt."""
-        if meeting_id not in self.state["download_attempts"]:
-            self.state["download_attempts"][meeting_id] = []
-        
-        self.state["download_attempts"][meeting_id].append({
+        self._record([{"op": "attempt", "id": meeting_id, "attempt": {
             "timestamp": datetime.now().isoformat(),
             "method": method,
             "success": success,
             "error": error
-        })
-        self.save()
+        }}])
     
     def mark_success(self, meeting_id: str, file_path: str, method: str, file_size: int):
         """Mark a meeting as successfully downloaded."""
-        if meeting_id in self.state["meetings"]:
-            self.state["meetings"][meeting_id]["status"] = "success"
-            self.state["meetings"][meeting_id]["download_path"] = str(file_path)
-            self.state["meetings"][meeting_id]["file_size"] = file_size
-            self.state["meetings"][meeting_id]["method_used"] = method
-        
-        if meeting_id not in self.state["successful_downloads"]:
-            self.state["successful_downloads"].append(meeting_id)
-        
-        if meeting_id in self.state["failed_downloads"]:
-            self.state["failed_downloads"].remove(meeting_id)
-        
-        self.save()
+        self._record([{"op": "success", "id": meeting_id, "path": str(file_path),
+                       "method": method, "size": file_size}])
     
     def mark_failure(self, meeting_id: str):
         """Mark a meeting as failed after all retries."""
-        if meeting_id in self.state["meetings"]:
-            self.state["meetings"][meeting_id]["status"] = "failed"
-        
-        if meeting_id not in self.state["failed_downloads"]:
-            self.state["failed_downloads"].append(meeting_id)
-        
-        self.save()
+        self._record([{"op": "failure", "id": meeting_id}])
+    
+    def get_preferred_strategy(self) -> Optional[str]:
+        """Method that produced the most recent successful download, if any."""
+        return self.state["preferred_strategy"]
     
     def get_pending_meetings(self) -> List[Dict]:
         """Get list of meetings that still need to be downloaded."""
-        pending = []
-        for meeting_id, info in self.state["meetings"].items():
-            if info["status"] == "pending" or info["status"] == "failed":
-                pending.append(info)
-        return pending
+        with self._lock:
+            return list(self._pending.values())
+    
+    def filter_not_downloaded(self, meetings: List[Dict]) -> List[Dict]:
+        """Drop meetings that were already downloaded, keeping the original order."""
+        success = self._success
+        return [m for m in meetings if m['id'] not in success]
     
     def is_downloaded(self, meeting_id: str) -> bool:
         """Check if a meeting has been successfully downloaded."""
-        return meeting_id in self.state["successful_downloads"]
+        return meeting_id in self._success
     
     def get_stats(self) -> Dict:
         """Get current download statistics."""
-        return {
-            "total_meetings": len(self.state["meetings"]),
-            "successful": len(self.state["successful_downloads"]),
-            "failed": len(self.state["failed_downloads"]),
-            "pending": len(self.get_pending_meetings())
-        }
+        with self._lock:
+            return {
+                "total_meetings": len(self.state["meetings"]),
+                "successful": len(self._success),
+                "failed": len(self._failed),
+                "pending": len(self._pending)
+            }
 
 
 # ============================================================================
@@ -182,14 +491,100 @@ def save_session(context: BrowserContext):
     logger.info(f"Session saved to {SESSION_FILE}")
 
 
+def block_heavy_resources(context: BrowserContext, resource_types=BLOCKED_RESOURCE_TYPES):
+    """Abort images, fonts, media and analytics requests - transcripts only need the DOM."""
+    def handle_route(route: Route):
+        request = route.request
+        if (request.resource_type in resource_types
+                or any(domain in request.url for domain in BLOCKED_DOMAINS)):
+            route.abort()
+        else:
+            route.continue_()
+    
+    context.route("**/*", handle_route)
+
+
+@lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
-    """Convert a string to a valid filename."""
-    name = re.sub(r'[<>:"/\\|?*\n\r\t]', '', name)
-    name = re.sub(r'\s+', '_', name)
-    name = re.sub(r'_+', '_', name)
+    """Convert a string to a valid filename (memoized - every strategy asks for the same title)."""
+    name = _BAD_CHARS_RE.sub('', name)
+    name = _WS_RE.sub('_', name)
+    name = _UNDERSCORES_RE.sub('_', name)
     return name[:80].strip('_')
 
 
+@contextmanager
+def _strategy_context(method: str, meeting_id: str, state: "DownloadState"):
+    """
+    Shared error handling for download strategies: an exception escaping the
+    body is logged and recorded as a failed attempt, then swallowed so the
+    strategy returns None and the next one can run.
+    """
+    try:
+        yield
+    except Exception as e:
+        logger.debug("[%s] Error: %s", method, e)
+        state.record_attempt(meeting_id, method, False, str(e))
+
+
+def write_transcript(save_path: Path, meeting: Dict, method: str, text: str) -> int:
+    """Write the header and transcript in a single write; returns the file size."""
+    header = (
+        f"Meeting: {meeting['title']}\n"
+        f"URL: {meeting['url']}\n"
+        f"Downloaded: {datetime.now().isoformat()}\n"
+        f"Method: {method}\n"
+        + "=" * 60 + "\n\n"
+    )
+    payload = (header + text).encode('utf-8')
+    save_path.write_bytes(payload)
+    return len(payload)
+
+
+def first_visible(page: Page, selector: str, js_filter: str = "() => true"):
+    """
+    Return the first visible element matching selector (optionally also passing
+    js_filter), checking every candidate in a single evaluate.
+    """
+    candidates = page.query_selector_all(selector)
+    if not candidates:
+        return None
+    handle = page.evaluate_handle(f"""(els) => {{
+        const visible = {VISIBLE_JS};
+        const accept = {js_filter};
+        return els.find(el => visible(el) && accept(el)) || null;
+    }}""", candidates)
+    return handle.as_element()
+
+
+class Poller:
+    """
+    Poll a predicate with geometrically growing intervals (0.05s, 0.08s, ...
+    up to cap) and return the moment it holds, instead of sleeping a fixed time.
+    """
+    
+    def __init__(self, start: float = 0.05, cap: float = 1.0, factor: float = 1.6):
+        self.start = start
+        self.cap = cap
+        self.factor = factor
+    
+    def wait(self, predicate, timeout: float) -> bool:
+        """Return True as soon as predicate() is truthy, False once timeout seconds pass."""
+        deadline = time.monotonic() + timeout
+        delay = self.start
+        while True:
+            try:
+                if predicate():
+                    return True
+            except Exception:
+                pass  # e.g. the page is mid-navigation; just poll again
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, self.cap, remaining))
+            delay *= self.factor
+
+
 def wait_with_retry(page: Page, selector: str, timeout: int = 10000, retries: int = 3) -> Optional[Any]:
     """Wait for a selector with retries."""
     for attempt in range(retries):
@@ -199,7 +594,7 @@ def wait_with_retry(page: Page, selector: str, timeout: int = 10000, retries: in
                 return element
         except PlaywrightTimeout:
             if attempt < retries - 1:
-                logger.debug(f"Retry {attempt + 1}/{retries} for selector: {selector}")
+                logger.debug("Retry %d/%d for selector: %s", attempt + 1, retries, selector)
                 time.sleep(1)
     return None
 
@@ -207,28 +602,77 @@ def wait_with_retry(page: Page, selector: str, timeout: int = 10000, retries: in
 # ============================================================================
 # LOGIN HANDLER
 # ============================================================================
-def automated_login(page: Page) -> bool:
+def is_login_url(url: str) -> bool:
+    """Check whether a URL is one of Otter's sign-in pages."""
+    url = url.lower()
+    return "signin" in url or "login" in url or "sign-in" in url
+
+
+def session_is_fresh() -> bool:
+    """Check whether the saved session is recent enough to trust when the probe can't tell."""
+    if not SESSION_FILE.exists():
+        return False
+    age_hours = (time.time() - SESSION_FILE.stat().st_mtime) / 3600
+    return age_hours < SESSION_MAX_AGE_HOURS
+
+
+def automated_login(page: Page, context: BrowserContext, state: DownloadState) -> bool:
     """
-    Automatically log in to Otter.ai using credentials from config.
-    Returns True if login successful, False otherwise.
+    Make sure the browser is logged in to Otter.ai.
+    A saved session of any age is tried first by going straight to the
+    conversations page; the credential form is only used if that lands back on
+    sign-in (or, for sessions older than SESSION_MAX_AGE_HOURS, if the page
+    never shows either outcome). Only a credential-form login records a new
+    session_created time. Returns True if login successful, False otherwise.
     """
+    if SESSION_FILE.exists():
+        logger.info("Trying saved session...")
+        settled = False
+        try:
+            page.goto(OTTER_CONVERSATIONS_URL, timeout=PAGE_LOAD_TIMEOUT, wait_until='domcontentloaded')
+            # Resolves on either outcome: redirected to sign-in, or conversations rendered
+            page.wait_for_function(
+                '''(selector) => /signin|login|sign-in/i.test(location.href)
+                    || document.querySelector(selector) !== null''',
+                arg=CONVERSATION_SELECTOR,
+                timeout=15000
+            )
+            settled = True
+        except PlaywrightTimeout:
+            pass
+        # An inconclusive probe is only trusted for a recently saved session
+        if not is_login_url(page.url) and (settled or session_is_fresh()):
+            logger.info("Saved session is valid, skipping login")
+            # Re-save: picks up refreshed cookies and restarts the age clock
+            # (session_created still records the last credential login)
+            save_session(context)
+            return True
+        logger.info("Saved session has expired")
+    
+    if not OTTER_EMAIL or not OTTER_PASSWORD:
+        logger.error("OTTER_EMAIL and OTTER_PASSWORD must be set (environment or .env) to log in")
+        return False
+    
     logger.info("Starting Otter.ai login...")
     
     try:
         page.goto(OTTER_LOGIN_URL, timeout=PAGE_LOAD_TIMEOUT, wait_until='domcontentloaded')
-        time.sleep(3)
         
-        # Check if already logged in
-        if "home" in page.url or "workspace" in page.url:
+        # Check if already logged in (Otter redirects signed-in users away)
+        try:
+            page.wait_for_url(_LOGGED_IN_URL_RE, timeout=3000)
             logger.info("Already logged in!")
+            save_session(context)
             return True
+        except PlaywrightTimeout:
+            pass
         
         # Accept cookies if present
         try:
             cookies_btn = page.wait_for_selector('button.accept-cookies-button', timeout=3000)
             if cookies_btn:
                 cookies_btn.click()
-                time.sleep(0.5)
+                cookies_btn.wait_for_element_state('hidden', timeout=2000)
         except:
             pass
         
@@ -245,8 +689,7 @@ def automated_login(page: Page) -> bool:
             try:
                 btn = page.wait_for_selector(selector, timeout=3000)
                 if btn and btn.is_visible():
-                    btn.click()
-                    time.sleep(1)
+                    btn.click()  # The email step below waits for its input
                     break
             except:
                 continue
@@ -268,7 +711,10 @@ def automated_login(page: Page) -> bool:
             return False
         
         email_input.fill(OTTER_EMAIL)
-        time.sleep(0.5)
+        try:
+            page.wait_for_selector('#otter-sign-in:not([disabled])', timeout=2000)
+        except PlaywrightTimeout:
+            pass
         
         # Step 3: Click "Sign in" button
         logger.info("Clicking Sign in...")
@@ -278,10 +724,13 @@ def automated_login(page: Page) -> bool:
                 signin_btn = page.wait_for_selector(selector, timeout=3000)
                 if signin_btn and signin_btn.is_visible():
                     signin_btn.click()
-                    time.sleep(2)
                     break
             except:
                 continue
+        try:
+            page.wait_for_selector('#otter-password, input[type="password"]', timeout=7000)
+        except PlaywrightTimeout:
+            pass
         
         # Step 4: Enter password
         logger.info("Entering password...")
@@ -300,7 +749,10 @@ def automated_login(page: Page) -> bool:
             return False
         
         password_input.fill(OTTER_PASSWORD)
-        time.sleep(0.5)
+        try:
+            page.wait_for_selector('#otter-password-next:not([disabled])', timeout=2000)
+        except PlaywrightTimeout:
+            pass
         
         # Step 5: Click "Next" to complete login
         logger.info("Completing login...")
@@ -316,12 +768,18 @@ def automated_login(page: Page) -> bool:
         
         # Wait for login to complete
         logger.info("Waiting for login to complete...")
-        time.sleep(8)  # Increased wait time
+        try:
+            page.wait_for_url(_LOGGED_IN_URL_RE, timeout=15000)
+        except PlaywrightTimeout:
+            pass
         
         # Verify login success
         current_url = page.url
-        if "home" in current_url or "workspace" in current_url or "conversations" in current_url:
+        if _LOGGED_IN_URL_RE.search(current_url):
             logger.info("Login successful!")
+            save_session(context)
+            state.state["session_created"] = datetime.now().isoformat()
+            state.save()
             return True
         
         # Check for error messages
@@ -332,7 +790,11 @@ def automated_login(page: Page) -> bool:
         else:
             logger.warning(f"Login status unclear. Current URL: {current_url}")
             # Might still be OK if redirected elsewhere
-            return "signin" not in current_url.lower()
+            if "signin" not in current_url.lower():
+                save_session(context)
+                state.state["session_created"] = datetime.now().isoformat()
+                state.save()
+                return True
         
         return False
         
@@ -350,60 +812,68 @@ def scroll_to_load_all(page: Page, max_scrolls: int = 500) -> int:
     Scroll the page to load all conversations (infinite scroll handler).
     Specifically targets the .otter-main-content__container which holds the transcript list.
     """
-    logger.info(f"Scrolling to load conversations (limit: {max_scrolls} scrolls)...")
+    logger.info("Scrolling to load conversations (limit: %d scrolls)...", max_scrolls)
     
-    previous_count = 0
-    no_change_count = 0
     scroll_count = 0
     
     # The specific scrollable container on Otter.ai
     container_selector = '.otter-main-content__container'
     
-    # First, check if the container exists
-    container = page.query_selector(container_selector)
+    # First, check if the container exists (it may still be rendering)
+    try:
+        container = page.wait_for_selector(container_selector, timeout=5000)
+    except PlaywrightTimeout:
+        container = None
     if container:
-        logger.info(f"Found Otter main content container: {container_selector}")
+        logger.info("Found Otter main content container: %s", container_selector)
     else:
         logger.warning("Could not find .otter-main-content__container, will try window scroll")
     
-    while no_change_count < 15 and scroll_count < max_scrolls:  # Increased patience to 15
-        # Scroll the specific container if found, otherwise window
-        if container:
-            try:
-                page.evaluate(f'''() => {{
-                    const container = document.querySelector('{container_selector}');
-                    if (container) {{
-                        container.scrollTop = container.scrollHeight;
-                    }}
-                }}''')
-            except Exception as e:
-                logger.debug(f"Container scroll error: {e}")
-                page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        else:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        
-        # Wait for lazy loading to complete
-        time.sleep(SCROLL_WAIT_TIME / 1000 + 1)  # Extra time for lazy load
+    # Measure what has loaded so far (cards, scroll height, visible spinner),
+    # then scroll the container (or window) to request the next batch -
+    # one round-trip per iteration.
+    # Otter.ai uses app-home-speech-card for transcript cards
+    selectors = {'container': container_selector, 'cards': CONVERSATION_SELECTOR, 'loading': LOADING_SELECTOR}
+    scroll_and_measure = '''({container, cards, loading}) => {
+        const el = document.querySelector(container) || document.scrollingElement;
+        const spinner = Array.from(document.querySelectorAll(loading)).some(s => s.offsetParent !== null);
+        const result = {count: document.querySelectorAll(cards).length, height: el.scrollHeight, loading: spinner};
+        el.scrollTop = el.scrollHeight;
+        return result;
+    }'''
+    measured = page.evaluate(scroll_and_measure, selectors)
+    previous_count, previous_height = measured['count'], measured['height']
+    stalled = 0
+    
+    while scroll_count < max_scrolls:
+        # Wait for lazy loading: proceed as soon as new cards appear
+        try:
+            page.wait_for_function(
+                '([cards, n]) => document.querySelectorAll(cards).length > n',
+                arg=[CONVERSATION_SELECTOR, previous_count],
+                timeout=SCROLL_WAIT_TIME + 1000
+            )
+        except PlaywrightTimeout:
+            pass  # Nothing new yet - the end-of-list check below decides
         
         scroll_count += 1
-        
-        # Count conversations - use multiple selectors for robustness
-        # Otter.ai uses app-home-speech-card for transcript cards
-        conversations = page.query_selector_all('app-home-speech-card, a[href*="/u/"]')
-        current_count = len(conversations)
-        
-        if current_count == previous_count:
-            no_change_count += 1
-        else:
-            no_change_count = 0
-        
+        measured = page.evaluate(scroll_and_measure, selectors)
+        current_count = measured['count']
+        grew = current_count != previous_count or measured['height'] != previous_height
+        stalled = 0 if grew else stalled + 1
         previous_count = current_count
         
         # Log progress every 10 scrolls
         if scroll_count % 10 == 0:
-            logger.info(f"Scroll progress: {scroll_count} scrolls, {current_count} conversations found")
+            logger.info("Scroll progress: %d scrolls, %d conversations found", scroll_count, current_count)
+        
+        # Reached the end: the list stopped growing and nothing is loading -
+        # or it hasn't grown for a few scrolls whatever the spinner says
+        if not grew and (not measured['loading'] or stalled >= SCROLL_STALL_LIMIT):
+            break
+        previous_height = measured['height']
     
-    logger.info(f"Loaded {previous_count} conversations after {scroll_count} scrolls")
+    logger.info("Loaded %d conversations after %d scrolls", previous_count, scroll_count)
     return previous_count
 
 
@@ -412,54 +882,224 @@ def extract_meeting_info(page: Page, state: DownloadState) -> List[Dict]:
     logger.info("Extracting meeting information...")
     
     meetings = []
-    links = page.query_selector_all('a[href*="/u/"]')
+    seen = set()
+    
+    # Read every link's href and text in a single round-trip to the browser
+    links = page.evaluate('''() => Array.from(document.querySelectorAll('a[href*="/u/"]'))
+        .map(a => ({href: a.getAttribute('href'), text: (a.innerText || '').trim()}))''')
     
     for link in links:
         try:
-            href = link.get_attribute('href')
+            href = link['href']
             if href and '/u/' in href:
-                match = re.search(r'/u/([a-zA-Z0-9_-]+)', href)
+                match = _ID_RE.search(href)
                 if match:
                     meeting_id = match.group(1)
                     
-                    # Skip short IDs (likely not meetings)
-                    if len(meeting_id) < 10:
+                    # Skip short IDs (likely not meetings) and duplicates
+                    if len(meeting_id) < 10 or meeting_id in seen:
                         continue
+                    seen.add(meeting_id)
                     
-                    # Try to get title
-                    try:
-                        title = link.inner_text().strip()
-                        if not title or len(title) < 2:
-                            title = f"Meeting_{meeting_id[:10]}"
-                    except:
+                    title = link['text']
+                    if not title or len(title) < 2:
                         title = f"Meeting_{meeting_id[:10]}"
                     
                     title = title[:100]
                     full_url = f"{OTTER_BASE_URL}/u/{meeting_id}"
                     
-                    # Avoid duplicates
-                    if not any(m['id'] == meeting_id for m in meetings):
-                        meetings.append({
-                            'id': meeting_id,
-                            'title': title,
-                            'url': full_url
-                        })
-                        # Register in state
-                        state.register_meeting(meeting_id, title, full_url)
+                    meetings.append({
+                        'id': meeting_id,
+                        'title': title,
+                        'url': full_url
+                    })
         except Exception as e:
-            logger.debug(f"Error extracting meeting info: {e}")
+            logger.debug("Error extracting meeting info: %s", e)
             continue
     
+    # Register in state
+    state.register_meetings_bulk(meetings)
     state.state["total_meetings_found"] = len(meetings)
     state.save()
     
-    logger.info(f"Found {len(meetings)} unique meetings")
+    logger.info("Found %d unique meetings", len(meetings))
     return meetings
 
 
 # ============================================================================
-# DOWNLOAD STRATEGIES
+# DIRECT API DOWNLOADS
 # ============================================================================
+def build_api_session(context: BrowserContext) -> Optional[Dict]:
+    """
+    Collect the logged-in browser's cookies and CSRF token so transcripts can
+    be exported through Otter's API instead of the UI.
+    Returns None if httpx is not installed.
+    """
+    if httpx is None:
+        logger.info("httpx not installed - API downloads disabled")
+        return None
+    
+    browser_cookies = context.cookies()
+    cookies = httpx.Cookies()
+    for cookie in browser_cookies:
+        cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
+    csrf_token = next((c['value'] for c in browser_cookies if c['name'] == 'csrftoken'), '')
+    
+    return {
+        'cookies': cookies,
+        'headers': {'x-csrftoken': csrf_token, 'referer': f"{OTTER_BASE_URL}/"},
+    }
+
+
+async def api_request(client: "httpx.AsyncClient", method: str, url: str, **kwargs) -> "httpx.Response":
+    """Send an API request, backing off and retrying when Otter rate-limits (429)."""
+    for attempt in range(3):
+        response = await client.request(method, url, **kwargs)
+        if response.status_code != 429:
+            break
+        await asyncio.sleep(DELAY_BETWEEN_DOWNLOADS * (attempt + 1))
+    response.raise_for_status()
+    return response
+
+
+def format_speech_transcript(speech: Dict) -> Optional[str]:
+    """Render the transcript segments of a speech API response as plain text."""
+    speakers = {s.get('id'): s.get('speaker_name') for s in speech.get('speakers') or []}
+    lines = []
+    for segment in speech.get('transcripts') or []:
+        text = (segment.get('transcript') or '').strip()
+        if not text:
+            continue
+        speaker = speakers.get(segment.get('speaker_id'))
+        lines.append(f"{speaker}: {text}" if speaker else text)
+    
+    if lines:
+        return '\n'.join(lines)
+    # Unknown layout - fall back to the generic search
+    return extract_transcript_from_data(speech)
+
+
+async def strategy_api_export(client: "httpx.AsyncClient", user_id: str, meeting: Dict,
+                              state: DownloadState) -> Optional[Path]:
+    """
+    Strategy 0: Export the transcript through Otter's API.
+    Needs no page at all, so it runs for every pending meeting before any
+    browser worker starts.
+    """
+    method = "api_export"
+    meeting_id = meeting['id']
+    title = sanitize_filename(meeting['title'])
+    
+    with _strategy_context(method, meeting_id, state):
+        logger.info(f"[{method}] Trying API export for: {meeting['title'][:40]}...")
+        
+        response = await api_request(
+            client, 'POST', f"{OTTER_API_URL}/bulk_export",
+            params={'userid': user_id},
+            data={'formats': ','.join(EXPORT_FORMATS), 'speech_otid_list': [meeting_id]}
+        )
+        
+        content_type = response.headers.get('content-type', '')
+        if not response.content or 'text/html' in content_type or 'json' in content_type:
+            state.record_attempt(meeting_id, method, False, f"Unexpected export response: {content_type}")
+            return None
+        
+        # Several formats come back zipped together
+        extension = 'zip' if len(EXPORT_FORMATS) > 1 else EXPORT_FORMATS[0]
+        filename = f"{title}_{meeting_id[:15]}.{extension}"
+        save_path = DOWNLOAD_DIR / filename
+        save_path.write_bytes(response.content)
+        
+        file_size = save_path.stat().st_size
+        logger.info(f"[{method}] Exported: {filename} ({file_size} bytes)")
+        state.record_attempt(meeting_id, method, True)
+        state.mark_success(meeting_id, save_path, method, file_size)
+        return save_path
+        
+    return None
+
+
+async def strategy_http_api(client: "httpx.AsyncClient", user_id: str, meeting: Dict,
+                            state: DownloadState) -> Optional[Path]:
+    """
+    Strategy 0b: Fetch the transcript JSON the web app itself loads and save
+    it as text. Used when the export endpoint fails; still no browser needed.
+    """
+    method = "http_api"
+    meeting_id = meeting['id']
+    title = sanitize_filename(meeting['title'])
+    
+    with _strategy_context(method, meeting_id, state):
+        logger.info(f"[{method}] Trying speech API for: {meeting['title'][:40]}...")
+        
+        response = await api_request(
+            client, 'GET', f"{OTTER_API_URL}/speech",
+            params={'otid': meeting_id, 'userid': user_id}
+        )
+        speech = response.json().get('speech') or {}
+        transcript_text = format_speech_transcript(speech)
+        
+        if transcript_text and len(transcript_text) > 100:
+            filename = f"{title}_{meeting_id[:15]}.txt"
+            save_path = DOWNLOAD_DIR / filename
+            
+            file_size = write_transcript(save_path, meeting, method, transcript_text)
+            logger.info(f"[{method}] Fetched: {filename} ({file_size} bytes)")
+            state.record_attempt(meeting_id, method, True)
+            state.mark_success(meeting_id, save_path, method, file_size)
+            return save_path
+        
+        state.record_attempt(meeting_id, method, False, "No transcript in speech response")
+        return None
+        
+    return None
+
+
+async def export_pending_via_api(api_session: Dict, pending: List[Dict], state: DownloadState) -> int:
+    """
+    Export pending meetings concurrently through one pooled HTTP client (HTTP/2 with h2),
+    with at most API_CONCURRENCY requests in flight.
+    Returns the number of meetings exported successfully.
+    """
+    async with httpx.AsyncClient(
+        http2=h2 is not None,
+        cookies=api_session['cookies'],
+        headers=api_session['headers'],
+        limits=httpx.Limits(
+            max_connections=API_MAX_CONNECTIONS,
+            max_keepalive_connections=API_MAX_CONNECTIONS
+        ),
+        timeout=PAGE_LOAD_TIMEOUT / 1000
+    ) as client:
+        try:
+            response = await client.get(f"{OTTER_API_URL}/user")
+            response.raise_for_status()
+            user_id = response.json()['userid']
+        except Exception as e:
+            logger.warning(f"Otter API unavailable, using browser downloads only: {e}")
+            return 0
+        
+        semaphore = asyncio.Semaphore(API_CONCURRENCY)
+        
+        async def bounded_export(meeting: Dict) -> Optional[Path]:
+            async with semaphore:
+                return (await strategy_api_export(client, user_id, meeting, state)
+                        or await strategy_http_api(client, user_id, meeting, state))
+        
+        results = await asyncio.gather(*(bounded_export(m) for m in pending))
+    
+    return sum(1 for result in results if result)
+
+
+def run_api_exports(api_session: Dict, pending: List[Dict], state: DownloadState) -> int:
+    """
+    Run export_pending_via_api to completion on a helper thread - the sync
+    Playwright event loop already owns the calling thread.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="API") as executor:
+        return executor.submit(asyncio.run, export_pending_via_api(api_session, pending, state)).result()
+
+
 def strategy_export_button(page: Page, meeting: Dict, state: DownloadState) -> Optional[Path]:
     """
     Strategy 1: Use the Export button in the UI.
@@ -469,99 +1109,84 @@ def strategy_export_button(page: Page, meeting: Dict, state: DownloadState) -> O
     meeting_id = meeting['id']
     title = sanitize_filename(meeting['title'])
     
-    try:
+    with _strategy_context(method, meeting_id, state):
         logger.info(f"[{method}] Trying export button for: {meeting['title'][:40]}...")
         
         # Find and click "More options" menu
         more_btn = None
-        more_selectors = [
-            'button[aria-label*="more" i]',
-            'button[aria-label*="options" i]',
-            'button.head-bar__menu-button',
-            '[data-testid="more-options"]',
-        ]
+        try:
+            page.wait_for_selector(JOINED_MORE_SELECTOR, timeout=5000)
+            more_btn = first_visible(page, JOINED_MORE_SELECTOR)
+        except:
+            pass
         
-        for selector in more_selectors:
+        # Try finding by icon content - scanned page-side in one call
+        if not more_btn:
             try:
-                more_btn = page.wait_for_selector(selector, timeout=5000)
-                if more_btn and more_btn.is_visible():
-                    break
-                more_btn = None
+                more_btn = page.evaluate_handle(f"""() => {{
+                    const visible = {VISIBLE_JS};
+                    return Array.from(document.querySelectorAll('button'))
+                        .find(b => visible(b) && /more_(horiz|vert)/.test(b.innerHTML)) || null;
+                }}""").as_element()
             except:
-                continue
-        
-        # Try finding by icon content
-        if not more_btn:
-            buttons = page.query_selector_all('button')
-            for btn in buttons:
-                try:
-                    if btn.is_visible():
-                        inner = btn.inner_html()
-                        if 'more_horiz' in inner or 'more_vert' in inner:
-                            more_btn = btn
-                            break
-                except:
-                    continue
+                pass
         
         if not more_btn:
-            logger.debug(f"[{method}] Could not find more options button")
+            logger.debug("[%s] Could not find more options button", method)
             state.record_attempt(meeting_id, method, False, "More options button not found")
             return None
         
         more_btn.click()
-        time.sleep(2)
         
-        # Click Export from dropdown
+        # Click Export from dropdown - the role query covers Otter's menu; the
+        # selector scan catches menus rendered without ARIA roles
         export_option = None
-        export_selectors = [
-            '[role="menuitem"]:has-text("Export")',
-            'li:has-text("Export")',
-            'span:has-text("Export")',
-            'button:has-text("Export")',
-        ]
-        
-        for selector in export_selectors:
+        try:
+            export_item = page.get_by_role("menuitem", name=EXPORT_NAME_RE).first
+            export_item.wait_for(state="visible", timeout=5000)
+            export_option = export_item
+        except PlaywrightTimeout:
             try:
-                items = page.query_selector_all(selector)
-                for item in items:
-                    if item.is_visible():
-                        text = item.inner_text()
-                        if 'Export' in text and 'Re-export' not in text:
-                            export_option = item
-                            break
-                if export_option:
-                    break
+                export_option = first_visible(
+                    page, JOINED_EXPORT_SELECTOR,
+                    "(el) => el.innerText.includes('Export') && !el.innerText.includes('Re-export')"
+                )
             except:
-                continue
+                pass
         
         if not export_option:
-            logger.debug(f"[{method}] Could not find Export menu option")
+            logger.debug("[%s] Could not find Export menu option", method)
             state.record_attempt(meeting_id, method, False, "Export option not found")
             return None
         
         export_option.click()
-        time.sleep(2)
         
         # Click the blue Export button in modal
-        confirm_selectors = [
-            'button.bg-primary:has-text("Export")',
-            'button[class*="primary"]:has-text("Export")',
-            'div[role="dialog"] button:has-text("Export")',
-            'button:has-text("Export"):not([disabled])',
+        dialog_confirm = page.get_by_role("dialog").get_by_role("button", name=EXPORT_NAME_RE).first
+        try:
+            dialog_confirm.wait_for(state="visible", timeout=5000)
+        except PlaywrightTimeout:
+            pass  # The fallback locators below decide
+        
+        confirm_locators = [
+            dialog_confirm,
+            page.locator('button.bg-primary:has-text("Export")').first,
+            page.locator('button[class*="primary"]:has-text("Export")').first,
+            page.locator('button:has-text("Export"):not([disabled])').first,
         ]
         
-        for selector in confirm_selectors:
+        for confirm in confirm_locators:
             try:
-                confirm = page.query_selector(selector)
-                if confirm and confirm.is_visible():
+                if confirm.is_visible():
                     with page.expect_download(timeout=DOWNLOAD_WAIT_TIME * 2) as download_info:
                         confirm.click()
                     download = download_info.value
                     
-                    # Save the file
+                    # Save the file - copy Playwright's finished temp file
+                    # directly (shutil.copyfile uses sendfile where available)
                     filename = f"{title}_{meeting_id[:15]}.txt"
                     save_path = DOWNLOAD_DIR / filename
-                    download.save_as(save_path)
+                    shutil.copyfile(download.path(), save_path)
                     
                     file_size = save_path.stat().st_size
                     logger.info(f"[{method}] Downloaded: {filename} ({file_size} bytes)")
@@ -569,16 +1194,13 @@ def strategy_export_button(page: Page, meeting: Dict, state: DownloadState) -> O
                     state.mark_success(meeting_id, save_path, method, file_size)
                     return save_path
             except Exception as e:
-                logger.debug(f"[{method}] Export button click failed: {e}")
+                logger.debug("[%s] Export button click failed: %s", method, e)
                 continue
         
         state.record_attempt(meeting_id, method, False, "Could not complete export")
         return None
         
-    except Exception as e:
-        logger.debug(f"[{method}] Error: {str(e)}")
-        state.record_attempt(meeting_id, method, False, str(e))
-        return None
+    return None
 
 
 def strategy_text_extraction(page: Page, meeting: Dict, state: DownloadState) -> Optional[Path]:
@@ -590,93 +1212,32 @@ def strategy_text_extraction(page: Page, meeting: Dict, state: DownloadState) ->
     meeting_id = meeting['id']
     title = sanitize_filename(meeting['title'])
     
-    try:
+    with _strategy_context(method, meeting_id, state):
         logger.info(f"[{method}] Trying text extraction for: {meeting['title'][:40]}...")
         
-        # Wait for transcript content to load - reduced
-        time.sleep(0.5)
-        
-        # Try various transcript selectors - optimized list
-        transcript_selectors = [
-            '.otter-transcript-container',
-            '[class*="transcript"]',
-            '[class*="speech"]',
-            '.monologue',
-            '.paragraph',
-        ]
-        
-        all_text = []
-        
-        # Try to get all text at once if possible for speed
+        # Wait for transcript content to render (returns immediately if it already has)
         try:
-            # Main transcript body is usually in a single container
-            main_container = page.query_selector('.otter-transcript-container, main, [role="main"]')
-            if main_container:
-                combined_text = main_container.inner_text()
-                if len(combined_text) > 500:
-                    all_text = [combined_text]
-        except:
+            page.locator(TRANSCRIPT_CONTENT_SELECTOR).first.wait_for(timeout=3000)
+        except PlaywrightTimeout:
             pass
-            
-        if not all_text:
-            for selector in transcript_selectors:
-                try:
-                    containers = page.query_selector_all(selector)
-                    for container in containers:
-                        try:
-                            text = container.inner_text().strip()
-                            if text and len(text) > 50:
-                                all_text.append(text)
-                        except:
-                            continue
-                    if all_text: break # Stop if we found content
-                except:
-                    continue
-        
-        # Combine and deduplicate text
-        combined_text = "\n\n".join(all_text)
         
-        # If not enough text, try getting all text from main content area
-        if len(combined_text) < 100:
-            try:
-                # Try to find main content area
-                main_selectors = ['main', '[role="main"]', '#root', '.app-content']
-                for selector in main_selectors:
-                    main_elem = page.query_selector(selector)
-                    if main_elem:
-                        combined_text = main_elem.inner_text()
-                        if len(combined_text) > 200:
-                            break
-            except:
-                pass
+        # Container text, per-selector text and main-area fallback all come
+        # back from a single evaluate rather than one inner_text call apiece
+        combined_text = page.evaluate(TEXT_EXTRACTION_JS, [
+            TRANSCRIPT_CONTAINER_SELECTOR, JOINED_TRANSCRIPT_SELECTOR, MAIN_CONTENT_SELECTORS
+        ]) or ""
         
         # Clean up the text
         if combined_text and len(combined_text) > 100:
-            # Remove common noise
-            lines = combined_text.split('\n')
-            clean_lines = []
-            for line in lines:
-                line = line.strip()
-                # Skip navigation/menu items
-                if line and len(line) > 5:
-                    if not any(x in line.lower() for x in ['sign out', 'settings', 'help', 'export', 'share']):
-                        clean_lines.append(line)
-            
-            clean_text = '\n'.join(clean_lines)
+            # Remove common noise over the whole blob at once
+            clean_text = _LINE_EDGE_WS_RE.sub('', combined_text)
+            clean_text = _NOISE_LINE_RE.sub('', clean_text).rstrip('\n')
             
             if len(clean_text) > 100:
                 filename = f"{title}_{meeting_id[:15]}.txt"
                 save_path = DOWNLOAD_DIR / filename
                 
-                with open(save_path, 'w', encoding='utf-8') as f:
-                    f.write(f"Meeting: {meeting['title']}\n")
-                    f.write(f"URL: {meeting['url']}\n")
-                    f.write(f"Downloaded: {datetime.now().isoformat()}\n")
-                    f.write(f"Method: {method}\n")
-                    f.write("=" * 60 + "\n\n")
-                    f.write(clean_text)
-                
-                file_size = save_path.stat().st_size
+                file_size = write_transcript(save_path, meeting, method, clean_text)
                 logger.info(f"[{method}] Extracted: {filename} ({file_size} bytes)")
                 state.record_attempt(meeting_id, method, True)
                 state.mark_success(meeting_id, save_path, method, file_size)
@@ -685,10 +1246,7 @@ def strategy_text_extraction(page: Page, meeting: Dict, state: DownloadState) ->
         state.record_attempt(meeting_id, method, False, "Insufficient text content found")
         return None
         
-    except Exception as e:
-        logger.debug(f"[{method}] Error: {str(e)}")
-        state.record_attempt(meeting_id, method, False, str(e))
-        return None
+    return None
 
 
 def strategy_direct_api(page: Page, meeting: Dict, state: DownloadState) -> Optional[Path]:
@@ -700,37 +1258,21 @@ def strategy_direct_api(page: Page, meeting: Dict, state: DownloadState) -> Opti
     meeting_id = meeting['id']
     title = sanitize_filename(meeting['title'])
     
-    try:
+    with _strategy_context(method, meeting_id, state):
         logger.info(f"[{method}] Trying API fetch for: {meeting['title'][:40]}...")
         
         # Otter uses GraphQL/REST APIs internally
         # We can intercept network requests or make direct API calls
         
-        # Try to find transcript data in page state (React/Vue state)
-        script = """
-        () => {
-            // Try to find transcript in window state
-            if (window.__NEXT_DATA__) {
-                return JSON.stringify(window.__NEXT_DATA__);
-            }
-            if (window.__INITIAL_STATE__) {
-                return JSON.stringify(window.__INITIAL_STATE__);
-            }
-            // Try React fiber
-            const root = document.getElementById('root');
-            if (root && root._reactRootContainer) {
-                return 'React app detected';
-            }
-            return null;
-        }
-        """
+        # Try to find transcript data in page state (React/Vue state).
+        # The object is returned by value, so there is no JSON.stringify on
+        # the page and no json parse here.
+        script = "() => window.__NEXT_DATA__ ?? window.__INITIAL_STATE__ ?? null"
         
-        result = page.evaluate(script)
+        data = page.evaluate(script)
         
-        if result and len(result) > 1000:
-            # Parse and extract transcript
+        if isinstance(data, (dict, list)) and data:
             try:
-                data = json.loads(result)
                 # Look for transcript content in the data
                 transcript_text = extract_transcript_from_data(data)
                 
@@ -738,15 +1280,7 @@ def strategy_direct_api(page: Page, meeting: Dict, state: DownloadState) -> Opti
                     filename = f"{title}_{meeting_id[:15]}.txt"
                     save_path = DOWNLOAD_DIR / filename
                     
-                    with open(save_path, 'w', encoding='utf-8') as f:
-                        f.write(f"Meeting: {meeting['title']}\n")
-                        f.write(f"URL: {meeting['url']}\n")
-                        f.write(f"Downloaded: {datetime.now().isoformat()}\n")
-                        f.write(f"Method: {method}\n")
-                        f.write("=" * 60 + "\n\n")
-                        f.write(transcript_text)
-                    
-                    file_size = save_path.stat().st_size
+                    file_size = write_transcript(save_path, meeting, method, transcript_text)
                     logger.info(f"[{method}] Fetched: {filename} ({file_size} bytes)")
                     state.record_attempt(meeting_id, method, True)
                     state.mark_success(meeting_id, save_path, method, file_size)
@@ -757,46 +1291,68 @@ def strategy_direct_api(page: Page, meeting: Dict, state: DownloadState) -> Opti
         state.record_attempt(meeting_id, method, False, "Could not fetch from API")
         return None
         
-    except Exception as e:
-        logger.debug(f"[{method}] Error: {str(e)}")
-        state.record_attempt(meeting_id, method, False, str(e))
-        return None
+    return None
 
 
-def extract_transcript_from_data(data: Dict, depth: int = 0) -> Optional[str]:
-    """Recursively search for transcript content in data structure."""
-    if depth > 10:
-        return None
-    
+# Keys most likely to hold transcript text, searched before other values
+TRANSCRIPT_DATA_KEYS = ('transcript', 'text', 'content', 'body', 'speech', 'monologue')
+_TRANSCRIPT_DATA_KEY_SET = frozenset(TRANSCRIPT_DATA_KEYS)
+_NO_MORE_CHILDREN = object()
+
+
+def _iter_data_children(node):
+    """Yield child values of a dict/list, priority keys first and none twice."""
+    if isinstance(node, dict):
+        for key in TRANSCRIPT_DATA_KEYS:
+            if key in node:
+                yield node[key]
+        for key, value in node.items():
+            if key not in _TRANSCRIPT_DATA_KEY_SET:
+                yield value
+    else:
+        yield from node
+
+
+def extract_transcript_from_data(data: Any, max_depth: int = 10) -> Optional[str]:
+    """
+    Search a data structure for transcript content.
+    Strings over 200 chars count as transcript text; a dict returns its first
+    match, a list joins the matches of all its items. Uses an explicit stack
+    so large page-state blobs don't pay for deep Python recursion.
+    """
     if isinstance(data, str):
-        if len(data) > 200:
-            return data
+        return data if len(data) > 200 else None
+    if not isinstance(data, (dict, list)):
         return None
     
-    if isinstance(data, dict):
-        # Look for common transcript keys
-        for key in ['transcript', 'text', 'content', 'body', 'speech', 'monologue']:
-            if key in data:
-                result = extract_transcript_from_data(data[key], depth + 1)
-                if result:
-                    return result
-        
-        # Recursively search all values
-        for value in data.values():
-            result = extract_transcript_from_data(value, depth + 1)
-            if result and len(result) > 200:
-                return result
-    
-    if isinstance(data, list):
-        texts = []
-        for item in data:
-            result = extract_transcript_from_data(item, depth + 1)
-            if result:
-                texts.append(result)
-        if texts:
-            return '\n'.join(texts)
+    # Frames are (children iterator, is_list, collected texts); the depth of
+    # a frame's children is len(stack)
+    stack = [(_iter_data_children(data), isinstance(data, list), [])]
+    result = None
+    while stack:
+        children, is_list, texts = stack[-1]
+        if result:
+            if not is_list:
+                # First hit in a dict wins - hand it straight to the parent
+                stack.pop()
+                continue
+            texts.append(result)
+            result = None
+        
+        child = next(children, _NO_MORE_CHILDREN)
+        if child is _NO_MORE_CHILDREN:
+            stack.pop()
+            result = '\n'.join(texts) if texts else None
+            continue
+        
+        if len(stack) > max_depth:
+            continue
+        if isinstance(child, str):
+            result = child if len(child) > 200 else None
+        elif isinstance(child, (dict, list)):
+            stack.append((_iter_data_children(child), isinstance(child, list), []))
     
-    return None
+    return result
 
 
 def strategy_screenshot_fallback(page: Page, meeting: Dict, state: DownloadState) -> Optional[Path]:
@@ -808,14 +1364,14 @@ def strategy_screenshot_fallback(page: Page, meeting: Dict, state: DownloadState
     meeting_id = meeting['id']
     title = sanitize_filename(meeting['title'])
     
-    try:
+    with _strategy_context(method, meeting_id, state):
         logger.info(f"[{method}] Taking screenshot for: {meeting['title'][:40]}...")
         
-        filename = f"{title}_{meeting_id[:15]}.png"
+        filename = f"{title}_{meeting_id[:15]}.jpg"
         save_path = DOWNLOAD_DIR / filename
         
         # Take full page screenshot
-        page.screenshot(path=str(save_path), full_page=True)
+        page.screenshot(path=str(save_path), full_page=True, type="jpeg", quality=SCREENSHOT_JPEG_QUALITY)
         
         if save_path.exists():
             file_size = save_path.stat().st_size
@@ -827,15 +1383,20 @@ def strategy_screenshot_fallback(page: Page, meeting: Dict, state: DownloadState
         state.record_attempt(meeting_id, method, False, "Screenshot save failed")
         return None
         
-    except Exception as e:
-        logger.debug(f"[{method}] Error: {str(e)}")
-        state.record_attempt(meeting_id, method, False, str(e))
-        return None
+    return None
 
 
 # ============================================================================
 # MAIN DOWNLOAD LOGIC
 # ============================================================================
+# Strategies that may be promoted to the front when they produced the last
+# success (the screenshot fallback always stays last)
+PREFERABLE_STRATEGIES = {
+    "text_extraction": strategy_text_extraction,
+    "direct_api": strategy_direct_api,
+}
+
+
 def download_meeting(page: Page, meeting: Dict, state: DownloadState, max_retries: int = 3) -> bool:
     """
     Download a single meeting transcript with multiple strategies and retries.
@@ -855,33 +1416,43 @@ def download_meeting(page: Page, meeting: Dict, state: DownloadState, max_retrie
         # strategy_export_button,  # DISABLED - always times out, wastes 2 minutes
     ]
     
+    # Whatever worked last time for this account goes first
+    preferred = PREFERABLE_STRATEGIES.get(state.get_preferred_strategy())
+    if preferred:
+        strategies = [preferred] + [s for s in strategies if s is not preferred]
+    
+    # Locators are lazy, so this one is built once and re-resolved after every navigation
+    transcript_area = page.locator(TRANSCRIPT_CONTAINER_SELECTOR).first
+    
     for retry in range(max_retries):
         logger.info(f"Attempt {retry + 1}/{max_retries} for: {meeting['title'][:40]}...")
+        timed_out = False
         
         try:
             # Navigate to meeting page - use 'commit' (fastest)
             logger.debug(f"Navigating to: {meeting['url']}")
             page.goto(meeting['url'], timeout=PAGE_LOAD_TIMEOUT, wait_until='commit')
             
-            # Minimal wait for page to load content - ULTRA FAST
-            time.sleep(1.5)
+            # Proceed as soon as the transcript area is in the DOM
+            transcript_area.wait_for(timeout=PAGE_LOAD_TIMEOUT)
             
             # Close any popups quickly
             close_popups(page)
             
-            # Try each strategy - minimal delay between
+            # Try each strategy back to back - they only read the already
+            # loaded page, so there is nothing to wait for in between
             for strategy in strategies:
                 try:
                     result = strategy(page, meeting, state)
                     if result:
                         return True
                 except Exception as e:
-                    logger.debug(f"Strategy {strategy.__name__} error: {e}")
-                time.sleep(0.5)  # Reduced from 1s
+                    logger.debug("Strategy %s error: %s", strategy.__name__, e)
             
             logger.warning(f"All strategies failed on attempt {retry + 1}")
             
         except PlaywrightTimeout:
+            timed_out = True
             logger.warning(f"Timeout on attempt {retry + 1} for: {meeting['title'][:40]}")
             state.record_attempt(meeting_id, "navigation", False, "Page load timeout")
             
@@ -889,11 +1460,16 @@ def download_meeting(page: Page, meeting: Dict, state: DownloadState, max_retrie
             logger.warning(f"Error on attempt {retry + 1}: {str(e)}")
             state.record_attempt(meeting_id, "navigation", False, str(e))
         
-        # Exponential backoff before retry
+        # Exponential backoff before retry. After a navigation timeout it is cut
+        # short once the late page renders its transcript area; any other
+        # failure already had that area, so it waits the full time
         if retry < max_retries - 1:
             wait_time = (2 ** retry) * 2
-            logger.info(f"Waiting {wait_time}s before retry...")
-            time.sleep(wait_time)
+            logger.info(f"Waiting up to {wait_time}s before retry...")
+            if timed_out:
+                Poller().wait(lambda: transcript_area.count() > 0, wait_time)
+            else:
+                time.sleep(wait_time)
     
     # Mark as failed after all retries
     state.mark_failure(meeting_id)
@@ -903,32 +1479,111 @@ def download_meeting(page: Page, meeting: Dict, state: DownloadState, max_retrie
 
 def close_popups(page: Page):
     """Close any popup dialogs that might appear."""
-    popup_close_selectors = [
-        'button[aria-label="Close"]',
-        'button:has-text("Got it")',
-        'button:has-text("×")',
-        '.close-button',
-        '[data-testid="close-button"]',
-        'button:has-text("Dismiss")',
-        'button:has-text("Later")',
+    try:
+        # Check for and click popups - one query and one visibility scan
+        btn = first_visible(page, JOINED_POPUP_SELECTOR)
+        if btn:
+            btn.click() # Only one popup is closed to save time
+    except:
+        pass
+
+
+def download_worker(work: queue.Queue, storage_state: Dict, state: DownloadState,
+                    total: int, results: List[bool]):
+    """
+    Drain meetings from the shared work queue using a dedicated browser.
+    Sync Playwright objects are bound to the thread that created them, so each
+    worker launches its own browser once and opens a fresh context per meeting.
+    """
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(
+                headless=HEADLESS,
+                slow_mo=SLOW_MO
+            )
+            try:
+                while True:
+                    try:
+                        i, meeting = work.get_nowait()
+                    except queue.Empty:
+                        break
+
+                    logger.info(f"[{i}/{total}] Processing: {meeting['title'][:50]}...")
+                    # A fresh context per meeting is cheap and keeps the driver from
+                    # accumulating route/request objects over a long run
+                    context = None
+                    try:
+                        context = browser.new_context(storage_state=storage_state)
+                        context.set_default_timeout(PAGE_LOAD_TIMEOUT * 2)
+                        block_heavy_resources(context)
+                        results.append(download_meeting(context.new_page(), meeting, state))
+                    except Exception as e:
+                        # One bad meeting must not take the worker down with it
+                        logger.error(f"Error downloading {meeting['title'][:40]}: {str(e)}")
+                        logger.debug(traceback.format_exc())
+                        state.mark_failure(meeting['id'])
+                        results.append(False)
+                    finally:
+                        if context is not None:
+                            context.close()
+
+                    # Rate limiting (per worker)
+                    time.sleep(DELAY_BETWEEN_DOWNLOADS)
+            finally:
+                browser.close()
+    except Exception as e:
+        # Remaining meetings stay on the queue for the other workers (and are
+        # marked failed by download_pending_parallel if no worker is left)
+        logger.error(f"Worker crashed: {str(e)}")
+        logger.debug(traceback.format_exc())
+
+
+def download_pending_parallel(storage_state: Dict, pending: List[Dict], state: DownloadState,
+                              workers: int) -> int:
+    """
+    Download pending meetings with a pool of browser workers sharing one session.
+    Returns the number of meetings downloaded successfully.
+    """
+    work = queue.Queue()
+    for item in enumerate(pending, 1):
+        work.put(item)
+
+    results: List[bool] = []
+    threads = [
+        threading.Thread(
+            target=download_worker,
+            args=(work, storage_state, state, len(pending), results),
+            name=f"Worker-{n + 1}",
+            daemon=True
+        )
+        for n in range(workers)
     ]
-    
-    for selector in popup_close_selectors:
+
+    logger.info(f"Starting {workers} download workers...")
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Left over only if every worker crashed - record them so the run reports failure
+    if not work.empty():
+        logger.error(f"All download workers stopped; marking {work.qsize()} remaining meetings as failed")
+    while True:
         try:
-            # Check for and click popups - streamlined
-            buttons = page.query_selector_all(selector)
-            for btn in buttons:
-                if btn.is_visible():
-                    btn.click()
-                    return # Exit after clicking one popup to save time
-        except:
-            continue
+            _, meeting = work.get_nowait()
+        except queue.Empty:
+            break
+        state.mark_failure(meeting['id'])
+        results.append(False)
+
+    return sum(results)
 
 
 # ============================================================================
 # MAIN ORCHESTRATION
 # ============================================================================
-def run_download(reset: bool = False, quick: bool = False, num: int = None):
+def run_download(reset: bool = False, quick: bool = False, num: int = None,
+                 workers: int = DOWNLOAD_WORKERS):
     """Main function to orchestrate the entire download process."""
     logger.info("=" * 60)
     logger.info("OTTER.AI TRANSCRIPT DOWNLOADER - PRODUCTION VERSION")
@@ -937,20 +1592,19 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
     
     setup_directories()
     
-    # Initialize state
-    state = DownloadState()
-    
     if reset:
+        # Delete before loading, so no pre-reset state (or journal replay) survives
         logger.info("Resetting state...")
-        if STATE_FILE.exists():
-            STATE_FILE.unlink()
-        if PROGRESS_FILE.exists():
-            PROGRESS_FILE.unlink()
+        for state_path in (STATE_FILE, STATE_JOURNAL_FILE, STATE_JOURNAL_OLD_FILE):
+            if state_path.exists():
+                state_path.unlink()
         if SESSION_FILE.exists():
             SESSION_FILE.unlink()
-        state = DownloadState()
         logger.info("State reset complete")
     
+    # Initialize state
+    state = DownloadState()
+    
     # Log current state
     stats = state.get_stats()
     logger.info(f"Current state: {stats['successful']} downloaded, {stats['pending']} pending, {stats['failed']} failed")
@@ -976,58 +1630,42 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
         
         # Set longer default timeouts
         context.set_default_timeout(PAGE_LOAD_TIMEOUT * 2)
+        block_heavy_resources(context)
         
         page = context.new_page()
         
         try:
-            # Navigate to Otter home
+            # Log in, reusing the saved session while it still works
             logger.info("Navigating to Otter.ai...")
-            page.goto(OTTER_CONVERSATIONS_URL, timeout=PAGE_LOAD_TIMEOUT * 2)
+            if not automated_login(page, context, state):
+                logger.error("Login failed. Please check credentials.")
+                # Take debug screenshot
+                page.screenshot(path=DOWNLOAD_DIR / "debug_login_failed.png")
+                browser.close()
+                return False
+            
+            # Navigate to conversations if login left us elsewhere
+            if not page.url.startswith(OTTER_CONVERSATIONS_URL):
+                logger.info("Navigating to conversations page after login...")
+                page.goto(OTTER_CONVERSATIONS_URL, timeout=PAGE_LOAD_TIMEOUT * 2)
             
             # Wait for page to stabilize
             try:
                 page.wait_for_load_state('networkidle', timeout=30000)
             except:
                 pass  # Timeout is OK, we'll check state anyway
-            time.sleep(3)
+            try:
+                page.wait_for_selector(CONVERSATION_SELECTOR, timeout=5000)
+            except PlaywrightTimeout:
+                pass
             
-            # Check current URL to determine login status
-            current_url = page.url.lower()
+            # Verify we're logged in now
             logger.info(f"Current URL after navigation: {page.url}")
-            
-            # Check if login needed - look for signin/login in URL
-            needs_login = "signin" in current_url or "login" in current_url or "sign-in" in current_url
-            
-            if needs_login:
-                logger.info("Login required - starting automated login...")
-                if not automated_login(page):
-                    logger.error("Login failed. Please check credentials.")
-                    # Take debug screenshot
-                    page.screenshot(path=DOWNLOAD_DIR / "debug_login_failed.png")
-                    browser.close()
-                    return False
-                
-                # Save session after successful login
-                save_session(context)
-                state.state["session_created"] = datetime.now().isoformat()
-                state.save()
-                
-                # Navigate back to conversations after login
-                logger.info("Navigating to conversations page after login...")
-                page.goto(OTTER_CONVERSATIONS_URL, timeout=PAGE_LOAD_TIMEOUT * 2)
-                try:
-                    page.wait_for_load_state('networkidle', timeout=30000)
-                except:
-                    pass
-                time.sleep(5)
-                
-                # Verify we're logged in now
-                current_url = page.url.lower()
-                if "signin" in current_url or "login" in current_url:
-                    logger.error("Still on login page after login attempt")
-                    page.screenshot(path=DOWNLOAD_DIR / "debug_still_on_login.png")
-                    browser.close()
-                    return False
+            if is_login_url(page.url):
+                logger.error("Still on login page after login attempt")
+                page.screenshot(path=DOWNLOAD_DIR / "debug_still_on_login.png")
+                browser.close()
+                return False
             
             logger.info("Login confirmed. Proceeding to load conversations...")
             
@@ -1038,7 +1676,7 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
                 scroll_to_load_all(page, max_scrolls=actual_max_scrolls)
             except Exception as e:
                 logger.warning(f"Scroll error (may be OK): {e}")
-                time.sleep(3)
+                Poller().wait(lambda: page.query_selector(CONVERSATION_SELECTOR) is not None, 3)
             
             # Extract meeting information
             meetings = extract_meeting_info(page, state)
@@ -1057,9 +1695,10 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
                 logger.info("Quick mode: Checking only the most recent meetings (top 15)")
                 meetings = meetings[:15]
             
-            # Filter to pending meetings
-            pending = [m for m in meetings if not state.is_downloaded(m['id'])]
-            logger.info(f"Meetings to download: {len(pending)} / {len(meetings)} total")
+            # Filter to pending meetings before any per-meeting browser work
+            pending = state.filter_not_downloaded(meetings)
+            logger.info(f"Meetings to download: {len(pending)} / {len(meetings)} total "
+                        f"({len(meetings) - len(pending)} already downloaded, skipped)")
             
             if not pending:
                 logger.info("All meetings already downloaded!")
@@ -1067,16 +1706,23 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
                 return True
             
             # Download each pending meeting
+            processed_count = len(pending)
             success_count = 0
-            for i, meeting in enumerate(pending, 1):
-                logger.info(f"\n[{i}/{len(pending)}] Processing: {meeting['title'][:50]}...")
-                
-                if download_meeting(page, meeting, state):
-                    success_count += 1
-                
-                # Rate limiting
-                if i < len(pending):
-                    time.sleep(DELAY_BETWEEN_DOWNLOADS)
+            
+            # Export through the API first; the browser strategies handle the rest
+            api_session = build_api_session(context)
+            if api_session:
+                success_count = run_api_exports(api_session, pending, state)
+                pending = state.filter_not_downloaded(pending)
+                logger.info(f"API exported {success_count} meetings, {len(pending)} left for the browser")
+            
+            if pending:
+                # Workers open their own browsers, seeded with this session;
+                # capped so a short backlog doesn't launch idle browsers
+                success_count += download_pending_parallel(
+                    context.storage_state(), pending, state,
+                    max(1, min(workers, len(pending)))
+                )
             
             # Final report
             final_stats = state.get_stats()
@@ -1092,9 +1738,9 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
             # Record run in history
             state.state["run_history"].append({
                 "timestamp": datetime.now().isoformat(),
-                "meetings_processed": len(pending),
+                "meetings_processed": processed_count,
                 "successful": success_count,
-                "failed": len(pending) - success_count
+                "failed": processed_count - success_count
             })
             state.save()
             
@@ -1112,6 +1758,7 @@ def run_download(reset: bool = False, quick: bool = False, num: int = None):
             raise
             
         finally:
+            state.flush()
             browser.close()
 
 
@@ -1120,14 +1767,18 @@ def main():
     parser.add_argument('--reset', action='store_true', help='Reset all progress and start fresh')
     parser.add_argument('--quick', action='store_true', help='Check only recent transcripts (Top 15)')
     parser.add_argument('--num', type=int, help='Limit processing to a specific number of top transcripts')
+    parser.add_argument('--workers', type=int, default=DOWNLOAD_WORKERS,
+                        help=f'Number of parallel browser workers (default: {DOWNLOAD_WORKERS})')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     args = parser.parse_args()
     
     if args.debug:
+        # Debug output is routed to the log file only
         logging.getLogger().setLevel(logging.DEBUG)
+        file_handler.setLevel(logging.DEBUG)
     
     try:
-        success = run_download(reset=args.reset, quick=args.quick, num=args.num)
+        success = run_download(reset=args.reset, quick=args.quick, num=args.num, workers=args.workers)
         exit(0 if success else 1)
     except KeyboardInterrupt:
         logger.info("\nInterrupted by user. Progress saved.")
@@ -2,39 +2,76 @@
 Otter.ai Parallel Transcript Downloader - FAST VERSION
 
 This script downloads transcripts in PARALLEL using multiple browser contexts
-for 3-4x faster downloads compared to sequential processing.
+for 3-4x faster downloads compared to sequential processing. All downloads
+share one browser and run as asyncio tasks, at most --workers at a time.
 
 Usage:
     python otter_parallel.py [--workers N]
 """
 
+import os
 import json
 import time
+import atexit
+import itertools
+import asyncio
 import argparse
 import re
+import queue
 import logging
+import threading
 import traceback
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from threading import Lock
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, TimeoutError as PlaywrightTimeout
+from playwright.async_api import (
+    async_playwright, Page, Browser, BrowserContext, Route, TimeoutError as PlaywrightTimeout
+)
+
+try:
+    import orjson  # Optional: much faster (de)serialization of state and session files
+except ImportError:
+    orjson = None
+
+try:
+    import httpx  # Optional: fetch transcripts over HTTP without opening a page
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # Optional: HTTP/2 for httpx (without it, httpx refuses http2=True)
+except ImportError:
+    h2 = None
+
+try:
+    import zstandard  # Optional: compressed transcript files (COMPRESS_TRANSCRIPTS)
+except ImportError:
+    zstandard = None
 
 from config import (
     OTTER_EMAIL, OTTER_PASSWORD,
-    DOWNLOAD_DIR, SESSION_FILE,
-    OTTER_BASE_URL, OTTER_LOGIN_URL, OTTER_CONVERSATIONS_URL,
-    PAGE_LOAD_TIMEOUT, SCROLL_WAIT_TIME,
-    HEADLESS, SLOW_MO
+    BASE_DIR, DOWNLOAD_DIR, SESSION_FILE,
+    OTTER_BASE_URL, OTTER_LOGIN_URL, OTTER_CONVERSATIONS_URL, OTTER_API_URL,
+    PAGE_LOAD_TIMEOUT, SCROLL_WAIT_TIME, STATE_JOURNAL_COMPACT_EVERY,
+    HEADLESS, SLOW_MO, PARALLEL_BLOCKED_RESOURCE_TYPES, BLOCKED_DOMAINS,
+    COMPRESS_TRANSCRIPTS, TRANSCRIPT_ZSTD_LEVEL
 )
 
 
 # ============================================================================
 # LOGGING SETUP
 # ============================================================================
-LOG_FILE = Path(__file__).parent / "otter_parallel.log"
-STATE_FILE = Path(__file__).parent / ".otter_state.json"
+LOG_FILE = BASE_DIR / "otter_parallel.log"
+STATE_FILE = BASE_DIR / ".otter_state.json"
+# Same journal as otter_downloader.py, so either script can replay the other's events
+STATE_JOURNAL_FILE = BASE_DIR / ".otter_state.journal.jsonl"
+STATE_JOURNAL_OLD_FILE = BASE_DIR / ".otter_state.journal.old.jsonl"
+# Group commit: the background flusher writes up to N journal lines at once,
+# waiting at most this long for a batch to fill
+JOURNAL_BATCH_SIZE = 32
+JOURNAL_BATCH_WAIT = 0.1  # seconds
 
 logging.basicConfig(
     level=logging.INFO,
@@ -53,210 +90,583 @@ state_lock = Lock()
 # ============================================================================
 # STATE MANAGEMENT (Thread-Safe)
 # ============================================================================
+def dump_json_bytes(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to JSON bytes (indented or compact), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class ParallelState:
-    """Thread-safe state management for parallel downloads."""
+    """
+    Thread-safe state management for parallel downloads.
+    
+    Completions are appended to the shared JSONL journal (one short line each);
+    the full state file is only rewritten when the journal is compacted - every
+    STATE_JOURNAL_COMPACT_EVERY events and at exit. Downloads only update memory
+    and queue the line; a background flusher thread does all the file I/O.
+    """
     
     def __init__(self):
         self.state_file = STATE_FILE
+        self.journal_file = STATE_JOURNAL_FILE
+        self.old_journal_file = STATE_JOURNAL_OLD_FILE
         self.state = self._load_state()
+        # Guards writes only; membership/progress reads use the set below,
+        # whose single operations are atomic, so readers never wait on a writer
         self.lock = Lock()
+        self._success = set(self.state["successful_downloads"])
+        # Failures are kept only as a set and written back as a list at save
+        self._failed = set(self.state["failed_downloads"])
+        self._completed = itertools.count(1)
         self.download_count = 0
         self.total_to_download = 0
+        self._journal = None
+        self._journal_events = 0
+        self._replay_journal()
+        # Journal lines waiting for the flusher (None = stop)
+        self._events = queue.SimpleQueue()
+        self._flusher = threading.Thread(target=self._flush_events, name="StateFlusher", daemon=True)
+        self._flusher.start()
+        atexit.register(self.shutdown)
     
     def _load_state(self) -> Dict[str, Any]:
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
-        return {
+        # Same schema as otter_downloader.py's DownloadState - both read this file
+        state = {
+            "session_created": None,
+            "last_run": None,
             "meetings": {},
+            "download_attempts": {},
             "successful_downloads": [],
             "failed_downloads": [],
+            "total_meetings_found": 0,
+            "run_history": [],
+            "preferred_strategy": None,
+            "journal_seq": 0,
         }
+        if self.state_file.exists():
+            try:
+                state.update(load_json_bytes(self.state_file.read_bytes()))
+            except:
+                pass
+        return state
+    
+    def _replay_journal(self):
+        """Apply journal events newer than the snapshot (torn lines from a crash are skipped)."""
+        snapshot_seq = self.state["journal_seq"]
+        for journal_file in (self.old_journal_file, self.journal_file):
+            if not journal_file.exists():
+                continue
+            with open(journal_file, 'rb') as f:
+                for line in f:
+                    try:
+                        event = load_json_bytes(line)
+                    except:
+                        continue
+                    if event.get("seq", 0) > snapshot_seq:
+                        self._apply_event(event)
+                        self.state["journal_seq"] = event["seq"]
+                        self._journal_events += 1
+    
+    def _apply_event(self, event: Dict):
+        """Apply one journal event to the state dict (caller holds the lock)."""
+        op = event["op"]
+        meeting_id = event["id"]
+        meetings = self.state.setdefault("meetings", {})
+        
+        if op == "register":
+            if meeting_id not in meetings:
+                meetings[meeting_id] = dict(event["meeting"])
+        
+        elif op == "attempt":
+            attempts = self.state.setdefault("download_attempts", {})
+            attempts.setdefault(meeting_id, []).append(event["attempt"])
+        
+        elif op == "success":
+            if meeting_id not in self._success:
+                self._success.add(meeting_id)
+                self.state["successful_downloads"].append(meeting_id)
+            self._failed.discard(meeting_id)
+            if meeting_id in meetings:
+                meetings[meeting_id]["status"] = "success"
+                meetings[meeting_id]["download_path"] = event["path"]
+                meetings[meeting_id]["file_size"] = event["size"]
+                meetings[meeting_id]["method_used"] = event["method"]
+        
+        elif op == "failure":
+            self._failed.add(meeting_id)
+            if meeting_id in meetings:
+                meetings[meeting_id]["status"] = "failed"
+                if event.get("error"):
+                    meetings[meeting_id]["error"] = event["error"]
+    
+    def _record(self, event: Dict):
+        """Apply an event in memory and queue its journal line for the flusher."""
+        with self.lock:
+            self.state["journal_seq"] += 1
+            event["seq"] = self.state["journal_seq"]
+            self._apply_event(event)
+            # Queued under the lock so lines reach the journal in seq order
+            self._events.put(dump_json_bytes(event) + b"\n")
+    
+    def _flush_events(self):
+        """Background flusher: write queued journal lines in batches, compacting when due."""
+        while True:
+            # Block for the first line, then give the batch a moment to fill
+            batch = [self._events.get()]
+            deadline = time.monotonic() + JOURNAL_BATCH_WAIT
+            while batch[-1] is not None and len(batch) < JOURNAL_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._events.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            stopping = batch[-1] is None
+            lines = [line for line in batch if line is not None]
+            if lines:
+                if self._journal is None:
+                    self._journal = open(self.journal_file, 'ab')
+                self._journal.write(b''.join(lines))
+                self._journal.flush()
+                self._journal_events += len(lines)
+                if self._journal_events >= STATE_JOURNAL_COMPACT_EVERY:
+                    self.save()
+            if stopping:
+                return
+    
+    def shutdown(self):
+        """Stop the flusher after it has written everything queued, then compact if anything changed."""
+        if self._flusher.is_alive():
+            self._events.put(None)
+            self._flusher.join()
+            if self._journal_events:
+                self.save(pretty=True)
     
-    def save(self):
+    def _rotate_journal(self):
+        """Move the journal aside; it is deleted once the next snapshot is written."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_events = 0
+        if not self.journal_file.exists():
+            return
+        if self.old_journal_file.exists():
+            # A previous compaction never finished - keep its events too
+            with open(self.old_journal_file, 'ab') as f:
+                f.write(self.journal_file.read_bytes())
+            self.journal_file.unlink()
+        else:
+            os.replace(self.journal_file, self.old_journal_file)
+    
+    def save(self, pretty: bool = False):
+        """
+        Write a full state snapshot and compact the journal (flusher thread or
+        after shutdown). Mid-run compactions write compact JSON; the final one
+        at shutdown is pretty-printed.
+        """
         with self.lock:
             self.state["last_run"] = datetime.now().isoformat()
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2)
+            self.state["failed_downloads"] = sorted(self._failed)
+            self._rotate_journal()
+            # Write a temp file and swap it in so a crash never leaves a torn state file
+            tmp_file = self.state_file.with_suffix('.tmp')
+            tmp_file.write_bytes(dump_json_bytes(self.state, pretty))
+            os.replace(tmp_file, self.state_file)
+            if self.old_journal_file.exists():
+                self.old_journal_file.unlink()
     
     def is_downloaded(self, meeting_id: str) -> bool:
-        with self.lock:
-            return meeting_id in self.state["successful_downloads"]
+        return meeting_id in self._success
     
-    def mark_success(self, meeting_id: str, path: Path, file_size: int):
-        with self.lock:
-            if meeting_id not in self.state["successful_downloads"]:
-                self.state["successful_downloads"].append(meeting_id)
-            if meeting_id in self.state.get("meetings", {}):
-                self.state["meetings"][meeting_id]["status"] = "success"
-                self.state["meetings"][meeting_id]["download_path"] = str(path)
-                self.state["meetings"][meeting_id]["file_size"] = file_size
-                self.state["meetings"][meeting_id]["method_used"] = "text_extraction"
-            self.download_count += 1
-            self.save()
+    def mark_success(self, meeting_id: str, path: Path, file_size: int, method: str = "text_extraction"):
+        self._record({"op": "success", "id": meeting_id, "path": str(path),
+                      "method": method, "size": file_size})
+        self.download_count = next(self._completed)
     
     def mark_failure(self, meeting_id: str, error: str):
-        with self.lock:
-            if meeting_id not in self.state["failed_downloads"]:
-                self.state["failed_downloads"].append(meeting_id)
-            if meeting_id in self.state.get("meetings", {}):
-                self.state["meetings"][meeting_id]["status"] = "failed"
-                self.state["meetings"][meeting_id]["error"] = error
-            self.save()
+        self._record({"op": "failure", "id": meeting_id, "error": error})
     
     def get_pending_meetings(self) -> List[Dict]:
         """Get all meetings that haven't been downloaded yet."""
-        pending = []
+        success = self._success
         with self.lock:
-            for meeting_id, meeting in self.state.get("meetings", {}).items():
-                if meeting_id not in self.state["successful_downloads"]:
-                    pending.append(meeting)
-        return pending
+            # Discovery order (newest first); set lookups keep this one O(n) pass
+            return [meeting for meeting_id, meeting in self.state.get("meetings", {}).items()
+                    if meeting_id not in success]
     
     def get_progress(self) -> tuple:
-        with self.lock:
-            downloaded = len(self.state["successful_downloads"])
-            total = len(self.state.get("meetings", {}))
-            return downloaded, total
+        return len(self._success), len(self.state.get("meetings", {}))
+
+
+# Characters that can't appear in filenames map to '_' (str.translate runs in C)
+_BAD_FILENAME_CHARS = str.maketrans({c: '_' for c in '<>:"/\\|?*\n\r'})
+_UNDERSCORES_RE = re.compile(r'_+')
 
 
 def sanitize_filename(title: str, max_length: int = 100) -> str:
     """Create a safe filename from the title."""
-    safe = re.sub(r'[<>:"/\\|?*\n\r]', '_', title)
-    safe = re.sub(r'_+', '_', safe)
+    safe = _UNDERSCORES_RE.sub('_', title.translate(_BAD_FILENAME_CHARS))
     return safe[:max_length].strip('_')
 
 
-def download_single_transcript(meeting: Dict, state: ParallelState, worker_id: int) -> bool:
+def load_session() -> Optional[Dict]:
+    """Load the saved login session (storage state) once for all workers."""
+    if SESSION_FILE.exists():
+        try:
+            return load_json_bytes(SESSION_FILE.read_bytes())
+        except:
+            pass
+    return None
+
+
+if COMPRESS_TRANSCRIPTS and zstandard is None:
+    logger.warning("COMPRESS_TRANSCRIPTS is set but zstandard is not installed - saving plain .txt")
+# Compressors are reusable, so one serves every transcript
+_zstd_compressor = zstandard.ZstdCompressor(level=TRANSCRIPT_ZSTD_LEVEL) if COMPRESS_TRANSCRIPTS and zstandard else None
+TRANSCRIPT_SUFFIX = ".txt.zst" if _zstd_compressor else ".txt"
+
+
+_HEADER_SEP = '=' * 60
+
+
+def transcript_header(meeting: Dict, method: str) -> str:
+    """Header written above every saved transcript."""
+    title = meeting.get('title', 'Unknown').partition('\n')[0]
+    return (f"Meeting: {title}\nURL: {meeting['url']}\n"
+            f"Downloaded: {datetime.now().isoformat()}\nMethod: {method}\n{_HEADER_SEP}\n\n")
+
+
+def write_transcript(out_file, meeting: Dict, method: str, parts: List[str]) -> int:
+    """
+    Stream the header and transcript parts to an open binary file, one
+    line per part, without joining them into one string first.
+    Returns the number of (uncompressed) bytes written.
+    """
+    data = transcript_header(meeting, method).encode('utf-8')
+    out_file.write(data)
+    written = len(data)
+    for i, part in enumerate(parts):
+        data = part.encode('utf-8')
+        if i:
+            out_file.write(b'\n')
+            written += 1
+        out_file.write(data)
+        written += len(data)
+    return written
+
+
+def save_transcript(save_path: Path, meeting: Dict, method: str, parts: List[str]) -> int:
+    """Write the transcript, zstd-compressed when enabled. Returns the uncompressed size."""
+    with open(save_path, 'wb', buffering=1 << 16) as f:
+        if _zstd_compressor is None:
+            return write_transcript(f, meeting, method, parts)
+        with _zstd_compressor.stream_writer(f, closefd=False) as compressed:
+            return write_transcript(compressed, meeting, method, parts)
+
+
+# ============================================================================
+# HTTP FETCH (no browser needed)
+# ============================================================================
+def build_api_client(session_data: Optional[Dict], num_workers: int) -> Optional["httpx.AsyncClient"]:
+    """
+    HTTP client (HTTP/2 with h2) carrying the saved session's cookies and CSRF token.
+    Returns None if httpx is not installed or there is no session.
+    """
+    if httpx is None or not session_data:
+        return None
+    
+    cookies = httpx.Cookies()
+    for cookie in session_data.get('cookies', []):
+        cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'], path=cookie['path'])
+    csrf_token = next((c['value'] for c in session_data.get('cookies', []) if c['name'] == 'csrftoken'), '')
+    
+    return httpx.AsyncClient(
+        http2=h2 is not None,
+        cookies=cookies,
+        headers={'x-csrftoken': csrf_token, 'referer': f"{OTTER_BASE_URL}/"},
+        limits=httpx.Limits(max_connections=num_workers * 4),
+        timeout=30
+    )
+
+
+async def get_api_user_id(client: "httpx.AsyncClient") -> Optional[str]:
+    """Otter user id for API calls, or None if the session isn't accepted."""
+    try:
+        response = await client.get(f"{OTTER_API_URL}/user")
+        response.raise_for_status()
+        return response.json()['userid']
+    except Exception as e:
+        logger.warning(f"Otter API unavailable, using the browser for every meeting: {e}")
+        return None
+
+
+async def fetch_transcript_via_api(client: "httpx.AsyncClient", user_id: str, meeting: Dict) -> tuple:
     """
-    Download a single transcript using its own browser context.
-    This function is designed to run in a thread.
+    Fetch the transcript JSON the web app itself loads. Conversation pages are
+    rendered client-side, so their HTML has no transcript - the API does.
+    Returns (header method, transcript lines).
+    """
+    response = await client.get(
+        f"{OTTER_API_URL}/speech",
+        params={'otid': meeting['id'], 'userid': user_id}
+    )
+    response.raise_for_status()
+    speech = response.json().get('speech') or {}
+    
+    speakers = {s.get('id'): s.get('speaker_name') for s in speech.get('speakers') or []}
+    lines = []
+    for segment in speech.get('transcripts') or []:
+        text = (segment.get('transcript') or '').strip()
+        if text:
+            speaker = speakers.get(segment.get('speaker_id'))
+            lines.append(f"{speaker}: {text}" if speaker else text)
+    
+    return "parallel_http_api", lines
+
+
+# ============================================================================
+# BROWSER FETCH (fallback)
+# ============================================================================
+async def block_heavy_resources(context: BrowserContext):
+    """Abort images, fonts, media, stylesheets and analytics - extraction only needs the DOM."""
+    async def handle_route(route: Route):
+        request = route.request
+        if (request.resource_type in PARALLEL_BLOCKED_RESOURCE_TYPES
+                or any(domain in request.url for domain in BLOCKED_DOMAINS)):
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    await context.route("**/*", handle_route)
+
+
+class LazyBrowser:
+    """
+    Launch Chromium on first use, so runs the API fully serves never start it.
+    The browser lives for the whole run; each meeting gets its own context.
+    """
+    
+    def __init__(self, playwright, session_data: Optional[Dict]):
+        self.playwright = playwright
+        self.context_options = {'storage_state': session_data} if session_data else {}
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+    
+    async def get(self) -> Browser:
+        async with self._lock:
+            if self._browser is None:
+                self._browser = await self.playwright.chromium.launch(
+                    headless=True,  # Always headless for parallel
+                    args=['--disable-gpu', '--no-sandbox', '--disable-blink-features=AutomationControlled']
+                )
+            return self._browser
+    
+    @asynccontextmanager
+    async def page(self):
+        """A page in a fresh context, closed afterwards."""
+        # A fresh context per meeting is cheap and keeps the driver from
+        # accumulating objects over a long run
+        context = await (await self.get()).new_context(**self.context_options)
+        try:
+            await block_heavy_resources(context)
+            yield await context.new_page()
+        finally:
+            await context.close()
+    
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+
+
+async def fetch_transcript_via_browser(browser: LazyBrowser, meeting: Dict) -> tuple:
+    """Render the conversation page in its own short-lived context and extract the text."""
+    async with browser.page() as page:
+        # Navigate to transcript page - minimal wait
+        await page.goto(meeting['url'], timeout=30000, wait_until='commit')
+        # Continue as soon as transcript text has rendered, waiting at most as
+        # long as the old fixed 2s sleep
+        try:
+            await page.wait_for_function(TRANSCRIPT_READY_JS, timeout=2000)
+        except PlaywrightTimeout:
+            pass
+        
+        # Extract transcript text
+        return await extract_transcript_text(page)
+
+
+async def download_single_transcript(meeting: Dict, state: ParallelState, browser: LazyBrowser,
+                                     api: Optional[tuple], task_label: str) -> bool:
+    """
+    Download a single transcript - over HTTP when the API is available,
+    otherwise (or if that fails) from the rendered page.
+    Runs as an asyncio task; many of these share the one client and browser.
     """
     meeting_id = meeting['id']
     title = meeting.get('title', 'Unknown')[:50]
-    url = meeting['url']
     
     if state.is_downloaded(meeting_id):
         return True
     
-    logger.info(f"[Worker-{worker_id}] Downloading: {title}...")
+    logger.info(f"[{task_label}] Downloading: {title}...")
     
     try:
-        with sync_playwright() as playwright:
-            browser = playwright.chromium.launch(
-                headless=True,  # Always headless for parallel
-                args=['--disable-gpu', '--no-sandbox']
-            )
+        method = "http_api"
+        header_method, parts = None, []
+        if api:
+            try:
+                header_method, parts = await fetch_transcript_via_api(*api, meeting)
+            except Exception as e:
+                logger.debug(f"[{task_label}] API fetch failed, using the browser: {e}")
+        
+        if not parts:
+            method = "text_extraction"
+            header_method, parts = await fetch_transcript_via_browser(browser, meeting)
+        
+        if parts:
+            # Save to file
+            filename = f"{sanitize_filename(title)}_{meeting_id[:15]}{TRANSCRIPT_SUFFIX}"
+            save_path = DOWNLOAD_DIR / filename
             
-            # Load session if exists
-            context_options = {}
-            if SESSION_FILE.exists():
-                try:
-                    with open(SESSION_FILE, 'r') as f:
-                        session_data = json.load(f)
-                    context_options['storage_state'] = session_data
-                except:
-                    pass
+            file_size = save_transcript(save_path, meeting, header_method, parts)
             
-            context = browser.new_context(**context_options)
-            page = context.new_page()
+            state.mark_success(meeting_id, save_path, file_size, method)
             
-            try:
-                # Navigate to transcript page - minimal wait
-                page.goto(url, timeout=30000, wait_until='commit')
-                time.sleep(2)  # Minimal wait for content
-                
-                # Extract transcript text
-                transcript_text = extract_transcript_text(page, meeting)
-                
-                if transcript_text and len(transcript_text) > 100:
-                    # Save to file
-                    filename = f"{sanitize_filename(title)}_{meeting_id[:15]}.txt"
-                    save_path = DOWNLOAD_DIR / filename
-                    
-                    with open(save_path, 'w', encoding='utf-8') as f:
-                        f.write(transcript_text)
-                    
-                    file_size = save_path.stat().st_size
-                    state.mark_success(meeting_id, save_path, file_size)
-                    
-                    downloaded, total = state.get_progress()
-                    logger.info(f"[Worker-{worker_id}] ✓ Downloaded [{downloaded}/{total}]: {title[:40]} ({file_size} bytes)")
-                    return True
-                else:
-                    state.mark_failure(meeting_id, "No transcript content found")
-                    logger.warning(f"[Worker-{worker_id}] ✗ No content: {title[:40]}")
-                    return False
-                    
-            finally:
-                context.close()
-                browser.close()
+            downloaded, total = state.get_progress()
+            logger.info(f"[{task_label}] ✓ Downloaded [{downloaded}/{total}]: {title[:40]} ({file_size} bytes)")
+            return True
+        else:
+            state.mark_failure(meeting_id, "No transcript content found")
+            logger.warning(f"[{task_label}] ✗ No content: {title[:40]}")
+            return False
                 
     except Exception as e:
         state.mark_failure(meeting_id, str(e))
-        logger.error(f"[Worker-{worker_id}] ✗ Error for {title[:40]}: {str(e)[:100]}")
+        logger.error(f"[{task_label}] ✗ Error for {title[:40]}: {str(e)[:100]}")
         return False
 
 
-def extract_transcript_text(page: Page, meeting: Dict) -> str:
-    """Extract transcript text from the page."""
+# Transcript containers, most specific first
+TRANSCRIPT_SELECTORS = [
+    '[class*="transcript"]',
+    '[class*="speech"]',
+    '.otterTranscript',
+    '[data-testid*="transcript"]',
+    'main',
+]
+# Transcript text has rendered - the app shell (<main>, empty containers)
+# attaches long before the transcript request fills it in
+TRANSCRIPT_READY_JS = """() => Array.from(document.querySelectorAll('[class*="transcript"]'))
+    .some((el) => el.innerText.trim().length > 200)"""
+
+# Gathers the text of every matching element in one round trip, plus the whole
+# body text as a fallback when no container has any. Selectors are tried most
+# specific first, and an element that is, contains or sits inside one already
+# taken is skipped (e.g. <main> around a transcript container)
+EXTRACT_TEXT_JS = """(selectors) => {
+    const parts = [];
+    const taken = [];
+    for (const selector of selectors) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (taken.some(t => t.contains(el) || el.contains(t))) continue;
+            const text = el.innerText;
+            if (text && text.length > 50) {
+                taken.push(el);
+                parts.push(text);
+            }
+        }
+    }
+    const body = parts.length || !document.body ? '' : document.body.innerText;
+    return {parts, body};
+}"""
+
+
+async def extract_transcript_text(page: Page) -> tuple:
+    """
+    Extract transcript text from the page.
+    Returns (header method, text parts); the parts are written out as-is
+    by write_transcript.
+    """
     try:
-        # Method 1: Look for transcript container
-        selectors = [
-            '[class*="transcript"]',
-            '[class*="speech"]',
-            '.otterTranscript',
-            '[data-testid*="transcript"]',
-            'main',
-        ]
+        # Method 1: Look for transcript containers (Method 2's body text
+        # comes back from the same evaluate)
+        extracted = await page.evaluate(EXTRACT_TEXT_JS, TRANSCRIPT_SELECTORS)
+        # Nested matches are already dropped in the page; this drops repeated
+        # text from separate elements (dict keys are a seen-set that keeps order)
+        content_parts = list(dict.fromkeys(extracted['parts']))
         
-        content_parts = []
-        
-        for selector in selectors:
-            try:
-                elements = page.query_selector_all(selector)
-                for el in elements:
-                    text = el.inner_text()
-                    if text and len(text) > 50:
-                        content_parts.append(text)
-            except:
-                continue
-        
-        # If we found content, format it
         if content_parts:
-            # Combine and deduplicate
-            all_text = '\n'.join(content_parts)
-            
-            # Create formatted output
-            header = f"""Meeting: {meeting.get('title', 'Unknown').split(chr(10))[0]}
-URL: {meeting['url']}
-Downloaded: {datetime.now().isoformat()}
-Method: parallel_text_extraction
-{'='*60}
-
-"""
-            return header + all_text
+            return "parallel_text_extraction", content_parts
         
         # Method 2: Get all visible text
-        body_text = page.evaluate('() => document.body.innerText')
+        body_text = extracted['body']
         if body_text and len(body_text) > 200:
-            header = f"""Meeting: {meeting.get('title', 'Unknown').split(chr(10))[0]}
-URL: {meeting['url']}
-Downloaded: {datetime.now().isoformat()}
-Method: parallel_body_extraction
-{'='*60}
-
-"""
-            return header + body_text
+            return "parallel_body_extraction", [body_text]
         
-        return ""
+        return None, []
         
     except Exception as e:
         logger.debug(f"Extraction error: {e}")
-        return ""
+        return None, []
+
+
+async def download_all(pending: List[Dict], state: ParallelState, num_workers: int) -> tuple:
+    """
+    Download every pending meeting through one shared HTTP client and (when
+    needed) one shared browser. num_workers worker coroutines pull meetings
+    from one shared iterator, so only num_workers downloads (and no
+    per-meeting task objects) exist at a time. Returns (succeeded, failed) counts.
+    """
+    session_data = load_session()
+    total = len(pending)
+    success_count = 0
+    fail_count = 0
+    
+    client = build_api_client(session_data, num_workers)
+    try:
+        api = None
+        if client is not None:
+            user_id = await get_api_user_id(client)
+            if user_id:
+                api = (client, user_id)
+        
+        async with async_playwright() as playwright:
+            browser = LazyBrowser(playwright, session_data)
+            try:
+                # Shared by all workers; next() never awaits, so no lock is needed
+                work = enumerate(pending, 1)
+                
+                async def worker():
+                    nonlocal success_count, fail_count
+                    for i, meeting in work:
+                        try:
+                            if await download_single_transcript(meeting, state, browser, api, f"{i}/{total}"):
+                                success_count += 1
+                            else:
+                                fail_count += 1
+                        except Exception as e:
+                            fail_count += 1
+                            logger.error(f"Task error: {e}")
+                
+                await asyncio.gather(*(worker() for _ in range(num_workers)))
+            finally:
+                await browser.close()
+    finally:
+        if client is not None:
+            await client.aclose()
+    
+    return success_count, fail_count
 
 
 def run_parallel_download(num_workers: int = 4):
@@ -290,30 +700,13 @@ def run_parallel_download(num_workers: int = 4):
     logger.info(f"Already downloaded: {downloaded_before}/{total}")
     
     start_time = time.time()
-    success_count = 0
-    fail_count = 0
     
-    # Run parallel downloads
-    with ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="Worker") as executor:
-        futures = {}
-        
-        for i, meeting in enumerate(pending):
-            worker_id = i % num_workers
-            future = executor.submit(download_single_transcript, meeting, state, worker_id)
-            futures[future] = meeting
-        
-        # Process completed downloads
-        for future in as_completed(futures):
-            meeting = futures[future]
-            try:
-                result = future.result()
-                if result:
-                    success_count += 1
-                else:
-                    fail_count += 1
-            except Exception as e:
-                fail_count += 1
-                logger.error(f"Future error: {e}")
+    # Run parallel downloads - asyncio tasks sharing one browser
+    num_workers = max(1, min(num_workers, len(pending)))
+    success_count, fail_count = asyncio.run(download_all(pending, state, num_workers))
+    
+    # Write out the journal tail and compact it into the state file
+    state.shutdown()
     
     # Final stats
     elapsed = time.time() - start_time